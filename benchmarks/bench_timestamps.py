@@ -0,0 +1,92 @@
+"""
+Compares timestamp parsing strategies on a page-sized batch of OkDesk timestamps.
+
+    python benchmarks/bench_timestamps.py
+"""
+import datetime
+import functools
+import os
+import sys
+import timeit
+import tracemalloc
+
+# run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from okdesk_api import helpers
+
+# ~ one page of 100 issues, 8 timestamps each
+SAMPLES = [
+    f"2016-03-{day:02d}T{hour:02d}:05:17.{ms:03d}+03:00"
+    for day in range(1, 26)
+    for hour in range(0, 24, 3)
+    for ms in (0, 568, 951, 428)
+][:800]
+
+TZ = datetime.timezone(datetime.timedelta(hours=3))
+
+
+def naive_fromisoformat(value):
+    return datetime.datetime.fromisoformat(value)
+
+
+def sliced_constructor(value):
+    return datetime.datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        int(value[20:23]) * 1000,
+        TZ,
+    )
+
+
+def strptime(value):
+    return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+def epoch_via_timestamp(value):
+    return int(datetime.datetime.fromisoformat(value).timestamp())
+
+
+CANDIDATES = {
+    "datetime.fromisoformat": naive_fromisoformat,
+    "helpers.parse_datetime": helpers.parse_datetime,
+    "parse_datetime(intern)": functools.partial(
+        helpers.parse_datetime, intern_timezone=True
+    ),
+    "sliced constructor": sliced_constructor,
+    "datetime.strptime": strptime,
+    "helpers.parse_epoch": helpers.parse_epoch,
+}
+
+
+def measure_memory(parse) -> int:
+    tracemalloc.start()
+    parsed = [parse(value) for value in SAMPLES]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return size
+
+
+def main(number: int = 200):
+    for value in SAMPLES[:50]:
+        assert helpers.parse_datetime(value) == naive_fromisoformat(value)
+        assert helpers.parse_datetime(
+            value, intern_timezone=True
+        ) == naive_fromisoformat(value)
+        assert helpers.parse_epoch(value) == epoch_via_timestamp(value)
+    print(f"{len(SAMPLES)} timestamps x {number} rounds")
+    for name, parse in CANDIDATES.items():
+        seconds = timeit.timeit(lambda: [parse(v) for v in SAMPLES], number=number)
+        per_value = seconds / (number * len(SAMPLES)) * 1e9
+        print(
+            f"{name:<26} {per_value:8.0f} ns/value {measure_memory(parse):10d} bytes/batch"
+        )
+
+
+if __name__ == "__main__":
+    main()
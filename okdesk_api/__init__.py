@@ -1,5 +1,5 @@
 from .client import OkDeskClient
-from .errors import OkDeskError
+from .errors import OkDeskError, PartialUploadError
 from . import types
 
-__all__ = ["OkDeskClient", "OkDeskError", "types"]
+__all__ = ["OkDeskClient", "OkDeskError", "PartialUploadError", "types"]
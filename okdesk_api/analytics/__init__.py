@@ -0,0 +1,27 @@
+from .issue_batch import (
+    IssueBatch,
+    Categorical,
+    Ragged,
+    MISSING_ID,
+    duration_seconds,
+)
+from .sla import (
+    SlaMetrics,
+    SlaSummary,
+    compute_sla,
+    aggregate_sla,
+    DEFAULT_AGE_BUCKETS,
+)
+
+__all__ = [
+    "IssueBatch",
+    "Categorical",
+    "Ragged",
+    "MISSING_ID",
+    "duration_seconds",
+    "SlaMetrics",
+    "SlaSummary",
+    "compute_sla",
+    "aggregate_sla",
+    "DEFAULT_AGE_BUCKETS",
+]
@@ -0,0 +1,303 @@
+import typing
+
+from .. import helpers
+
+# numpy is an optional dependency: pip install okdesk_api[analytics]
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# value of int columns for missing ids
+MISSING_ID = -1
+
+_INT64_MIN = -(2**63)  # int64 representation of NaT
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "numpy is required for okdesk_api.analytics (pip install okdesk_api[analytics])"
+        )
+
+
+class Categorical:
+    """
+    Column of repeated string values, stored as int32 codes into `categories`.
+    Missing values have code -1.
+    (Категориальная колонка: коды int32 и список уникальных значений.)
+    """
+
+    __slots__ = ("codes", "categories")
+
+    def __init__(self, codes: "np.ndarray", categories: typing.Sequence[str]):
+        self.codes = codes
+        self.categories: typing.Tuple[str, ...] = tuple(categories)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, item) -> "Categorical":
+        return Categorical(self.codes[item], self.categories)
+
+    def __repr__(self):
+        return f"Categorical(categories={self.categories!r}, size={len(self.codes)})"
+
+    def code_of(self, value: str) -> int:
+        """Returns code of the value, or -1 if the value is not present"""
+        try:
+            return self.categories.index(value)
+        except ValueError:
+            return -1
+
+    def isin(self, values: typing.Iterable[str]) -> "np.ndarray":
+        """Returns boolean mask of rows, which value is one of `values`"""
+        codes = [self.code_of(value) for value in values]
+        return np.isin(self.codes, [code for code in codes if code != -1])
+
+    def __eq__(self, other) -> "np.ndarray":
+        if isinstance(other, str):
+            code = self.code_of(other)
+            if code == -1:
+                return np.zeros(len(self.codes), dtype=bool)
+            return self.codes == code
+        return NotImplemented
+
+    def __ne__(self, other) -> "np.ndarray":
+        if isinstance(other, str):
+            return ~(self == other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def to_list(self) -> typing.List[typing.Optional[str]]:
+        return [self.categories[code] if code != -1 else None for code in self.codes]
+
+
+class Ragged:
+    """
+    Column of variable-length int lists: values of row `i` are `values[offsets[i]:offsets[i + 1]]`.
+    (Колонка списков переменной длины: значения и массив смещений.)
+    """
+
+    __slots__ = ("values", "offsets")
+
+    def __init__(self, values: "np.ndarray", offsets: "np.ndarray"):
+        self.values = values
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row(self, index: int) -> "np.ndarray":
+        return self.values[self.offsets[index] : self.offsets[index + 1]]
+
+    def __getitem__(self, item) -> "Ragged":
+        rows = np.arange(len(self))[item]
+        lengths = self.lengths()[rows]
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        if len(rows):
+            value_index = np.repeat(self.offsets[:-1][rows] - offsets[:-1], lengths)
+            value_index += np.arange(offsets[-1], dtype=np.int64)
+            values = self.values[value_index]
+        else:
+            values = self.values[:0]
+        return Ragged(values, offsets)
+
+    def __repr__(self):
+        return f"Ragged(rows={len(self)}, values={len(self.values)})"
+
+    def lengths(self) -> "np.ndarray":
+        return np.diff(self.offsets)
+
+    def row_index(self) -> "np.ndarray":
+        """Returns index of the row for every item of `values`"""
+        return np.repeat(np.arange(len(self)), self.lengths())
+
+    def contains(self, value: int) -> "np.ndarray":
+        """Returns boolean mask of rows, which list contains `value`"""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.row_index()[self.values == value]] = True
+        return mask
+
+    def to_list(self) -> typing.List[typing.List[int]]:
+        return [self.row(i).tolist() for i in range(len(self))]
+
+
+class IssueBatch:
+    """
+    Column-wise storage of issues for vectorized filtering and grouping (requires numpy).
+    (Хранение заявок по колонкам для векторных вычислений, требует numpy.)
+
+    Columns:
+        id, company_id, group_id, assignee_id - int64, missing values are MISSING_ID
+        created_at, deadline_at, completed_at, reacted_at, planned_reaction_at,
+        start_execution_until - datetime64[s] in UTC, missing values are NaT
+        status, priority, type - Categorical of codes
+        equipment_ids, child_ids - Ragged
+
+    >>> batch = IssueBatch.from_json(pages)
+    >>> opened = batch[batch.status == "opened"]
+    >>> opened.count_by("company_id")
+    """
+
+    _INT_COLUMNS = ("id", "company_id", "group_id", "assignee_id")
+    # int columns, which are read from nested objects: column -> (key, nested key)
+    _NESTED_INT_COLUMNS = {"assignee_id": ("assignee", "id")}
+    _DATETIME_COLUMNS = (
+        "created_at",
+        "deadline_at",
+        "completed_at",
+        "reacted_at",
+        "planned_reaction_at",
+        "start_execution_until",
+    )
+    _CATEGORICAL_COLUMNS = ("status", "priority", "type")
+    _RAGGED_COLUMNS = ("equipment_ids", "child_ids")
+    COLUMNS = _INT_COLUMNS + _DATETIME_COLUMNS + _CATEGORICAL_COLUMNS + _RAGGED_COLUMNS
+
+    __slots__ = COLUMNS
+
+    def __init__(self, **columns):
+        for name in self.COLUMNS:
+            setattr(self, name, columns[name])
+
+    @classmethod
+    def from_json(cls, pages: typing.Iterable[typing.Iterable[dict]]) -> "IssueBatch":
+        """
+        Builds batch from raw issue dicts, as returned by the API.
+        (Создает набор из исходных словарей заявок, полученных от API.)
+
+        :param pages: Iterable of pages, every page is an iterable of raw issue dicts
+        """
+        _require_numpy()
+        ints = {name: [] for name in cls._INT_COLUMNS}
+        nested_ints = {name: ints.pop(name) for name in cls._NESTED_INT_COLUMNS}
+        dates = {name: [] for name in cls._DATETIME_COLUMNS}
+        codes = {name: [] for name in cls._CATEGORICAL_COLUMNS}
+        categories = {name: {} for name in cls._CATEGORICAL_COLUMNS}
+        ragged_values = {name: [] for name in cls._RAGGED_COLUMNS}
+        ragged_offsets = {name: [0] for name in cls._RAGGED_COLUMNS}
+        parse_epoch = helpers.parse_epoch
+
+        for page in pages:
+            for issue in page:
+                for name, column in ints.items():
+                    value = issue.get(name)
+                    column.append(MISSING_ID if value is None else value)
+                for name, column in nested_ints.items():
+                    key, nested_key = cls._NESTED_INT_COLUMNS[name]
+                    value = (issue.get(key) or {}).get(nested_key)
+                    column.append(MISSING_ID if value is None else value)
+                for name, column in dates.items():
+                    value = parse_epoch(issue.get(name))
+                    column.append(_INT64_MIN if value is None else value)
+                for name, column in codes.items():
+                    value = issue.get(name)
+                    if value:
+                        category_codes = categories[name]
+                        code = category_codes.setdefault(
+                            value["code"], len(category_codes)
+                        )
+                    else:
+                        code = -1
+                    column.append(code)
+                for name, column in ragged_values.items():
+                    value = issue.get(name)
+                    if value:
+                        column.extend(value)
+                    ragged_offsets[name].append(len(column))
+
+        columns = {}
+        ints.update(nested_ints)
+        for name, column in ints.items():
+            columns[name] = np.array(column, dtype=np.int64)
+        for name, column in dates.items():
+            columns[name] = np.array(column, dtype=np.int64).view("datetime64[s]")
+        for name, column in codes.items():
+            columns[name] = Categorical(
+                np.array(column, dtype=np.int32), categories[name]
+            )
+        for name, column in ragged_values.items():
+            columns[name] = Ragged(
+                np.array(column, dtype=np.int64),
+                np.array(ragged_offsets[name], dtype=np.int64),
+            )
+        return cls(**columns)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={len(self)})"
+
+    def __getitem__(self, item) -> "IssueBatch":
+        """Returns batch with selected rows (boolean mask, index array or slice)"""
+        return self.__class__(
+            **{name: getattr(self, name)[item] for name in self.COLUMNS}
+        )
+
+    filter = __getitem__
+
+    def _group_keys(self, column: str) -> typing.Tuple["np.ndarray", typing.List]:
+        values = getattr(self, column)
+        if isinstance(values, Categorical):
+            return values.codes, [
+                values.categories[code] if code != -1 else None
+                for code in range(-1, len(values.categories))
+            ]
+        if isinstance(values, Ragged):
+            raise TypeError(f"Can not group by list column {column}")
+        return values, None
+
+    def group_indices(self, column: str) -> typing.Dict[typing.Any, "np.ndarray"]:
+        """
+        Returns row indices for every distinct value of the column.
+        (Возвращает индексы строк для каждого значения колонки.)
+        """
+        keys, labels = self._group_keys(column)
+        unique, inverse = np.unique(keys, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.cumsum(np.bincount(inverse, minlength=len(unique)))[:-1]
+        groups = np.split(order, bounds)
+        return {
+            self._label(key, labels): group
+            for key, group in zip(unique.tolist(), groups)
+        }
+
+    def count_by(self, column: str) -> typing.Dict[typing.Any, int]:
+        """
+        Returns number of rows for every distinct value of the column.
+        (Возвращает количество строк для каждого значения колонки.)
+        """
+        keys, labels = self._group_keys(column)
+        unique, counts = np.unique(keys, return_counts=True)
+        return {
+            self._label(key, labels): count
+            for key, count in zip(unique.tolist(), counts.tolist())
+        }
+
+    @staticmethod
+    def _label(key, labels):
+        if labels is None:
+            return key
+        return labels[key + 1]
+
+
+def duration_seconds(values: typing.Iterable[typing.Optional[str]]) -> "np.ndarray":
+    """
+    Converts OkDesk duration strings (e.g. StatusTime.total) into int64 array of seconds.
+    Every distinct string is parsed once, missing values and values in unknown format are -1.
+    (Преобразует строки длительности в массив секунд int64.)
+    """
+    _require_numpy()
+    values = np.array([value or "" for value in values], dtype=object)
+    if not len(values):
+        return np.zeros(0, dtype=np.int64)
+    unique, inverse = np.unique(values, return_inverse=True)
+    parsed = (helpers.parse_duration(value, strict=False) for value in unique)
+    seconds = np.array(
+        [-1 if value is None else value for value in parsed], dtype=np.int64
+    )
+    return seconds[inverse.reshape(-1)]
@@ -0,0 +1,203 @@
+import datetime
+import typing
+
+from .issue_batch import IssueBatch, np, _require_numpy
+
+_NAT = -(2**63)
+
+DEFAULT_AGE_BUCKETS = (
+    datetime.timedelta(days=1),
+    datetime.timedelta(days=3),
+    datetime.timedelta(days=7),
+    datetime.timedelta(days=30),
+)
+
+
+class SlaSummary(typing.TypedDict):
+    issues: int
+    reaction_late: int
+    overdue: int
+    start_late: int
+    # mean reaction lateness (seconds) of late reactions, None if there are none
+    reaction_lateness_mean: typing.Optional[float]
+    age_buckets: typing.Dict[str, int]
+
+
+def _format_edge(edge: datetime.timedelta) -> str:
+    seconds = int(edge.total_seconds())
+    if seconds % 86400 == 0:
+        return f"{seconds // 86400}d"
+    if seconds % 3600 == 0:
+        return f"{seconds // 3600}h"
+    return f"{seconds}s"
+
+
+def _age_bucket_labels(edges: typing.Sequence[datetime.timedelta]) -> typing.List[str]:
+    names = [_format_edge(edge) for edge in edges]
+    labels = [f"<{names[0]}"]
+    labels += [f"{low}-{high}" for low, high in zip(names, names[1:])]
+    labels.append(f">={names[-1]}")
+    return labels
+
+
+class SlaMetrics:
+    """
+    Per-issue SLA metrics of an IssueBatch, every field is an array aligned with the batch rows.
+    (Показатели SLA по каждой заявке набора, массивы выровнены по строкам набора.)
+
+    reaction_lateness - seconds between planned_reaction_at and reacted_at (or `now` if there
+        was no reaction yet), negative if reacted in time, NaN if planned_reaction_at is not set
+    reaction_late - reaction_lateness > 0
+    overdue_by - seconds between deadline_at and completed_at (or `now`), NaN if there is no deadline
+    overdue - overdue_by > 0
+    start_late - issue is still in not started status after start_execution_until
+    age - seconds between created_at and completed_at (or `now`), NaN if created_at is not set
+    age_bucket - index of `age_bucket_labels` for age, -1 if age is NaN
+    """
+
+    __slots__ = (
+        "reaction_lateness",
+        "reaction_late",
+        "overdue_by",
+        "overdue",
+        "start_late",
+        "age",
+        "age_bucket",
+        "age_bucket_labels",
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields[name])
+
+    def __len__(self) -> int:
+        return len(self.overdue)
+
+
+def _seconds(column: "np.ndarray") -> typing.Tuple["np.ndarray", "np.ndarray"]:
+    values = column.view(np.int64)
+    return values.astype(np.float64), values == _NAT
+
+
+def _lateness(planned: "np.ndarray", actual: "np.ndarray", now: int) -> "np.ndarray":
+    planned, planned_missing = _seconds(planned)
+    actual, actual_missing = _seconds(actual)
+    actual[actual_missing] = now
+    lateness = actual - planned
+    lateness[planned_missing] = np.nan
+    return lateness
+
+
+def compute_sla(
+    batch: IssueBatch,
+    now: typing.Optional[datetime.datetime] = None,
+    age_buckets: typing.Sequence[datetime.timedelta] = DEFAULT_AGE_BUCKETS,
+    not_started_statuses: typing.Iterable[str] = ("opened",),
+) -> SlaMetrics:
+    """
+    Computes per-issue SLA metrics with numpy.
+    (Вычисляет показатели SLA по каждой заявке.)
+
+    :param batch: Issues (Набор заявок)
+    :param now: Time used for unfinished issues, current time by default (Текущее время)
+    :param age_buckets: Ascending edges of age buckets (Границы интервалов возраста заявок)
+    :param not_started_statuses: Status codes of issues, which execution is not started yet
+        (Коды статусов, в которых выполнение заявки еще не начато)
+    """
+    _require_numpy()
+    if now is None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+    elif now.tzinfo is None:
+        now = now.replace(tzinfo=datetime.timezone.utc)
+    now = int(now.timestamp())
+
+    reaction_lateness = _lateness(batch.planned_reaction_at, batch.reacted_at, now)
+    overdue_by = _lateness(batch.deadline_at, batch.completed_at, now)
+
+    start_until, start_until_missing = _seconds(batch.start_execution_until)
+    not_started = batch.status.isin(not_started_statuses)
+    start_late = not_started & ~start_until_missing & (start_until < now)
+
+    created, created_missing = _seconds(batch.created_at)
+    finished, finished_missing = _seconds(batch.completed_at)
+    finished[finished_missing] = now
+    age = finished - created
+    age[created_missing] = np.nan
+
+    edges = np.array([edge.total_seconds() for edge in age_buckets], dtype=np.float64)
+    age_bucket = np.searchsorted(edges, age, side="right").astype(np.int32)
+    age_bucket[created_missing] = -1
+
+    with np.errstate(invalid="ignore"):
+        reaction_late = reaction_lateness > 0
+        overdue = overdue_by > 0
+    return SlaMetrics(
+        reaction_lateness=reaction_lateness,
+        reaction_late=reaction_late,
+        overdue_by=overdue_by,
+        overdue=overdue,
+        start_late=start_late,
+        age=age,
+        age_bucket=age_bucket,
+        age_bucket_labels=_age_bucket_labels(age_buckets),
+    )
+
+
+def aggregate_sla(
+    batch: IssueBatch,
+    metrics: SlaMetrics,
+    by: typing.Literal["company_id", "assignee_id", "group_id"] = "company_id",
+) -> typing.Dict[typing.Any, SlaSummary]:
+    """
+    Aggregates SLA metrics per company, assignee or group.
+    (Агрегирует показатели SLA по компаниям, ответственным или группам.)
+
+    :param batch: Issues, metrics were computed for (Набор заявок)
+    :param metrics: Result of compute_sla (Результат compute_sla)
+    :param by: Column to group by (Колонка для группировки)
+    :return: Dict of group key (MISSING_ID for issues without it) -> SlaSummary
+    """
+    _require_numpy()
+    keys, inverse = np.unique(getattr(batch, by), return_inverse=True)
+    size = len(keys)
+
+    def count(mask: "np.ndarray") -> typing.List[int]:
+        return (
+            np.bincount(inverse, weights=mask, minlength=size).astype(np.int64).tolist()
+        )
+
+    issues = np.bincount(inverse, minlength=size).tolist()
+    reaction_late = count(metrics.reaction_late)
+    lateness_sum = np.bincount(
+        inverse,
+        weights=np.where(metrics.reaction_late, metrics.reaction_lateness, 0.0),
+        minlength=size,
+    ).tolist()
+
+    labels = metrics.age_bucket_labels
+    valid_age = metrics.age_bucket != -1
+    bucket_counts = np.bincount(
+        inverse[valid_age] * len(labels) + metrics.age_bucket[valid_age],
+        minlength=size * len(labels),
+    ).reshape(size, len(labels))
+
+    result = {}
+    for columns in zip(
+        keys.tolist(),
+        issues,
+        reaction_late,
+        lateness_sum,
+        count(metrics.overdue),
+        count(metrics.start_late),
+        bucket_counts.tolist(),
+    ):
+        key, total, late, late_sum, overdue, start_late, buckets = columns
+        result[key] = SlaSummary(
+            issues=total,
+            reaction_late=late,
+            overdue=overdue,
+            start_late=start_late,
+            reaction_lateness_mean=late_sum / late if late else None,
+            age_buckets=dict(zip(labels, buckets)),
+        )
+    return result
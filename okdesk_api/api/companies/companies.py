@@ -147,9 +147,35 @@ Content-Type: application/json
 }"""
 
 
-class Company(types.OkDeskBaseClass):
+class Company(types.ParametersMixin):
     """https://okdesk.ru/apidoc#!kompanii-poisk-kompanii"""
 
+    __slots__ = (
+        "id",
+        "name",
+        "additional_name",
+        "site",
+        "email",
+        "phone",
+        "crm_1c_id",
+        "active",
+        "address",
+        "comment",
+        "coordinates",
+        "observers",
+        "contacts",
+        "default_assignee",
+        "category",
+        "attachments",
+        "parameters",
+    )
+    _schema = {
+        "observers": types.Field(interned=True, container="list"),
+        "default_assignee": types.Field(interned=True),
+        "category": types.Field(interned=True),
+        "attachments": types.Field(model=shared.Attachment, container="list"),
+    }
+
     def __init__(self):
         self.id: int = None
         self.name: str = None
@@ -169,31 +195,6 @@ class Company(types.OkDeskBaseClass):
         self.attachments: typing.List[shared.Attachment] = None
         self.parameters: typing.List[dict] = None
 
-    @classmethod
-    def json_parse(cls, dict_data: dict) -> "Company":
-        new_instance = cls()
-        new_instance.id = dict_data.get("id")
-        new_instance.name = dict_data.get("name")
-        new_instance.additional_name = dict_data.get("additional_name")
-        new_instance.site = dict_data.get("site")
-        new_instance.email = dict_data.get("email")
-        new_instance.phone = dict_data.get("phone")
-        new_instance.crm_1c_id = dict_data.get("crm_1c_id")
-        new_instance.active = dict_data.get("active")
-        new_instance.address = dict_data.get("address")
-        new_instance.comment = dict_data.get("comment")
-        new_instance.coordinates = dict_data.get("coordinates")
-        new_instance.observers = dict_data.get("observers")
-        new_instance.contacts = dict_data.get("contacts")
-        new_instance.default_assignee = dict_data.get("default_assignee")
-        new_instance.category = dict_data.get("category")
-        for attachment in dict_data.get("attachments", []):
-            new_instance.attachments.append(shared.Attachment.json_parse(attachment))
-        if not new_instance.attachments:
-            new_instance.attachments = None
-        new_instance.parameters = dict_data.get("parameters")
-        return new_instance
-
 
 class FindCompanyRequest(types.ApiRequest):
     """
@@ -527,6 +528,8 @@ class GetCompanyListRequest(types.ApiRequest):
     Пример: page[direction]=forward
     """
 
+    _parse_options = ("fields", "lazy")
+
     def __init__(
         self,
         category_ids: typing.List[int] = None,
@@ -543,6 +546,8 @@ class GetCompanyListRequest(types.ApiRequest):
         page_size: int = None,
         page_from_id: int = None,
         page_direction: typing.Literal["reverse", "forward"] = None,
+        lazy: bool = False,
+        fields: typing.Optional[typing.List[str]] = None,
     ):
         """
 
@@ -560,6 +565,8 @@ class GetCompanyListRequest(types.ApiRequest):
         :param page_size: Number of returned records. Cannot exceed 100. (Число возвращаемых записей. Не может превышать 100.)
         :param page_from_id: ID of companies from which the selection of records begins. By default (if the direction parameter is not set) the selection is made in the direction from the value of from_id towards the decrease of the company id. (ID компаний, с которой начинается выборка записей. По умолчанию (если не задан параметр direction) выборка осуществляется в направлении от значения from_id в сторону уменьшения id компании.)
         :param page_direction: Direction of selection. Two values are available: reverse, forward. reverse - returns records whose ID is less than the value of from_id, if the from_id parameter is passed. If the from_id parameter is not passed, the selection is made from the largest company id value. forward - returns records whose ID is greater than the value of from_id, if the from_id parameter is passed. If the from_id parameter is not passed, the selection is made from the smallest company id value. (Направление выборки. Доступно два значения: reverse, forward. reverse - возвращает записи, ID которых меньше значения from_id, если параметр from_id передан. При отсутствии параметра from_id выборка осуществляется от наибольшего значения id компании. forward - возвращает записи, ID которых больше значения from_id, если параметр from_id передан. При отсутствии параметра from_id выборка осуществляется от наименьшего значения id компании.)
+        :param lazy: If True, returns lazy models, which parse fields on first access (Если True, поля разбираются при первом обращении)
+        :param fields: If set, returns lightweight records with only these fields, e.g. ["id", "name", "category.code"] (Если задано, возвращаются записи только с этими полями)
         """
         self.category_ids: typing.List[int] = category_ids
         self.default_assignee_ids: typing.List[int] = default_assignee_ids
@@ -576,6 +583,8 @@ class GetCompanyListRequest(types.ApiRequest):
         self.page_size: int = page_size
         self.page_from_id: int = page_from_id
         self.page_direction: typing.Literal["reverse", "forward"] = page_direction
+        self.lazy: bool = lazy
+        self.fields: typing.Optional[typing.List[str]] = fields
 
     def to_request(self) -> dict:
         params: typing.Dict[str, typing.Union[str, typing.List[str]]] = {}
@@ -629,7 +638,10 @@ class GetCompanyListRequest(types.ApiRequest):
         return {"method": "GET", "url": "api/v1/companies/list", "params": params}
 
     def from_response(self, response: dict) -> typing.List[Company]:
-        return [Company.json_parse(x) for x in response]
+        if self.fields:
+            return [Company.json_project(x, self.fields) for x in response]
+        parse = Company.json_parse_lazy if self.lazy else Company.json_parse
+        return [parse(x) for x in response]
 
 
 class GetCompanyFileRequest(types.ApiRequest):
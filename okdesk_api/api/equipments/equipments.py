@@ -5,7 +5,7 @@ from ... import helpers
 from ... import types
 
 
-class Equipment(types.OkDeskBaseClass):
+class Equipment(types.ParametersMixin):
     """
     https://okdesk.ru/apidoc#!redaktirovanie-oborudovaniya-informacziya-ob-oborudovanii
 
@@ -67,6 +67,21 @@ class Equipment(types.OkDeskBaseClass):
 
     """
 
+    __slots__ = (
+        "id",
+        "serial_number",
+        "inventory_number",
+        "comment",
+        "company",
+        "maintenance_entity_id",
+        "parent_id",
+        "parameters",
+        "equipment_kind",
+        "equipment_manufacturer",
+        "equipment_model",
+        "agreements",
+    )
+
     def __init__(self):
         self.id: int = None
         self.serial_number: str = None
@@ -81,23 +96,6 @@ class Equipment(types.OkDeskBaseClass):
         self.equipment_model: dict = {}
         self.agreements: typing.List[dict] = []
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "Equipment":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.serial_number = data.get("serial_number")
-        instance.inventory_number = data.get("inventory_number")
-        instance.comment = data.get("comment")
-        instance.company = data.get("company")
-        instance.maintenance_entity_id = data.get("maintenance_entity_id")
-        instance.parent_id = data.get("parent_id")
-        instance.parameters = data.get("parameters")
-        instance.equipment_kind = data.get("equipment_kind")
-        instance.equipment_manufacturer = data.get("equipment_manufacturer")
-        instance.equipment_model = data.get("equipment_model")
-        instance.agreements = data.get("agreements")
-        return instance
-
 
 class FindEquipmentRequest(types.ApiRequest):
     """
@@ -411,6 +409,8 @@ class ListEquipmentsRequest(types.ApiRequest):
     Пример: page[direction]=forward
     """
 
+    _parse_options = ("fields",)
+
     def __init__(
         self,
         company_ids: typing.Optional[typing.List[int]] = None,
@@ -425,6 +425,7 @@ class ListEquipmentsRequest(types.ApiRequest):
         page_size: typing.Optional[int] = None,
         page_from_id: typing.Optional[int] = None,
         page_direction: typing.Optional[typing.Literal["reverse", "forward"]] = None,
+        fields: typing.Optional[typing.List[str]] = None,
     ):
         """
 
@@ -440,6 +441,7 @@ class ListEquipmentsRequest(types.ApiRequest):
         :param page_size: Number of returned records (Число возвращаемых записей)
         :param page_from_id: ID of equipment from which the selection starts (ID оборудования, с которого начинается выборка записей)
         :param page_direction: Selection direction (Направление выборки)
+        :param fields: If set, returns lightweight records with only these fields, e.g. ["id", "serial_number", "equipment_kind.code"] (Если задано, возвращаются записи только с этими полями)
         """
         self.company_ids = company_ids
         self.maintenance_entity_ids = maintenance_entity_ids
@@ -453,6 +455,7 @@ class ListEquipmentsRequest(types.ApiRequest):
         self.page_size = page_size
         self.page_from_id = page_from_id
         self.page_direction = page_direction
+        self.fields = fields
 
     def to_request(self) -> dict:
         params: typing.Dict[str, typing.Union[str, typing.List[str]]] = {}
@@ -498,4 +501,6 @@ class ListEquipmentsRequest(types.ApiRequest):
         }
 
     def from_response(self, result) -> typing.List[Equipment]:
+        if self.fields:
+            return [Equipment.json_project(item, self.fields) for item in result]
         return [Equipment.json_parse(item) for item in result]
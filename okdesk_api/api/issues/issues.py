@@ -1,9 +1,5 @@
-import os.path
-
 import datetime
 import typing
-import mimetypes
-from requests_toolbelt import MultipartEncoder
 from ... import helpers
 from ... import types
 from .. import shared
@@ -24,6 +20,8 @@ class Comment(types.OkDeskBaseClass):
     }
     """
 
+    __slots__ = ("id", "content", "public", "attachments", "author")
+
     def __init__(self):
         self.id: int = None
         self.content: str = None
@@ -31,16 +29,6 @@ class Comment(types.OkDeskBaseClass):
         self.attachments: typing.List[AddCommentRequest.Attachment] = None
         self.author: types.IdNameTypePair = None
 
-    @classmethod
-    def json_parse(cls, json_data: dict) -> "Comment":
-        instance = cls()
-        instance.id = json_data.get("id")
-        instance.content = json_data.get("content")
-        instance.public = json_data.get("public")
-        instance.attachments = json_data.get("attachments")
-        instance.author = json_data.get("author")
-        return instance
-
 
 class Employee(types.OkDeskBaseClass):
     """
@@ -54,19 +42,13 @@ class Employee(types.OkDeskBaseClass):
     }
     """
 
+    __slots__ = ("id", "name", "group")
+
     def __init__(self):
         self.id: int = None
         self.name: str = None
         self.group: typing.Optional[types.IdNamePair] = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "Employee":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.name = data.get("name")
-        instance.group = data.get("group")
-        return instance
-
 
 class StatusTime(types.OkDeskBaseClass):
     """
@@ -76,16 +58,27 @@ class StatusTime(types.OkDeskBaseClass):
     }
     """
 
+    __slots__ = ("total", "on_schedule_total")
+
     def __init__(self):
         self.total: str = None
         self.on_schedule_total: str = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "StatusTime":
-        instance = cls()
-        instance.total = data.get("total")
-        instance.on_schedule_total = data.get("on_schedule_total")
-        return instance
+    @property
+    def total_seconds(self) -> typing.Optional[int]:
+        """
+        Total time in status, in seconds, None if empty or in unknown format
+        (Общее время в статусе, в секундах, None если не задано или в неизвестном формате)
+        """
+        return helpers.parse_duration(self.total, strict=False)
+
+    @property
+    def on_schedule_total_seconds(self) -> typing.Optional[int]:
+        """
+        Time in status according to schedule, in seconds, None if empty or in unknown format
+        (Время в статусе по графику, в секундах, None если не задано или в неизвестном формате)
+        """
+        return helpers.parse_duration(self.on_schedule_total, strict=False)
 
 
 class IssueType(types.OkDeskBaseClass):
@@ -98,21 +91,14 @@ class IssueType(types.OkDeskBaseClass):
       }
     """
 
+    __slots__ = ("id", "code", "name", "available_for_client")
+
     def __init__(self):
         self.id: int = None
         self.code: str = None
         self.name: str = None
         self.available_for_client: bool = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "IssueType":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.code = data.get("code")
-        instance.name = data.get("name")
-        instance.available_for_client = data.get("available_for_client")
-        return instance
-
 
 class Specification(types.OkDeskBaseClass):
     """{
@@ -138,6 +124,19 @@ class Specification(types.OkDeskBaseClass):
       }
     }"""
 
+    __slots__ = (
+        "id",
+        "name",
+        "quantity",
+        "discount",
+        "total",
+        "comment",
+        "total_vat",
+        "service",
+        "price_list",
+        "performer",
+    )
+
     def __init__(self):
         self.id: int = None
         self.name: str = None
@@ -150,23 +149,8 @@ class Specification(types.OkDeskBaseClass):
         self.price_list: types.IdNamePair = None
         self.performer: types.IdNamePair = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "Specification":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.name = data.get("name")
-        instance.quantity = data.get("quantity")
-        instance.discount = data.get("discount")
-        instance.total = data.get("total")
-        instance.comment = data.get("comment")
-        instance.total_vat = data.get("total_vat")
-        instance.service = data.get("service")
-        instance.price_list = data.get("price_list")
-        instance.performer = data.get("performer")
-        return instance
-
-
-class TimeEntry(types.OkDeskBaseClass):
+
+class TimeEntry(types.ParametersMixin):
     """{
       "id": 1,
       "comment": "Упаковка",
@@ -187,25 +171,17 @@ class TimeEntry(types.OkDeskBaseClass):
       ]
     },"""
 
+    __slots__ = ("id", "comment", "spent_time", "logged_at", "employee", "parameters")
+    _schema = {"logged_at": types.Field(datetime=True)}
+
     def __init__(self):
         self.id: int = None
         self.comment: str = None
         self.spent_time: float = None
-        self.logged_at: str = None
+        self.logged_at: typing.Optional[datetime.datetime] = None
         self.employee: Employee = None
         self.parameters: typing.List[dict] = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "TimeEntry":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.comment = data.get("comment")
-        instance.spent_time = data.get("spent_time")
-        instance.logged_at = data.get("logged_at")
-        instance.employee = data.get("employee")
-        instance.parameters = data.get("parameters")
-        return instance
-
 
 class CheckListItem(types.OkDeskBaseClass):
     """{
@@ -246,12 +222,28 @@ class CheckListItem(types.OkDeskBaseClass):
         "checked": true
     }"""
 
+    __slots__ = (
+        "id",
+        "name",
+        "required",
+        "visible_for_clients",
+        "checked_at",
+        "parameters",
+        "item_type",
+        "parent_id",
+        "planned_execution_in_hours",
+        "position",
+        "checked_by_user_id",
+        "checked",
+    )
+    _schema = {"checked_at": types.Field(datetime=True)}
+
     def __init__(self):
         self.id: int = None
         self.name: str = None
         self.required: bool = None
         self.visible_for_clients: bool = None
-        self.checked_at: str = None
+        self.checked_at: typing.Optional[datetime.datetime] = None
         self.parameters: typing.List[dict] = None
         self.item_type: str = None
         self.parent_id: int = None
@@ -260,28 +252,11 @@ class CheckListItem(types.OkDeskBaseClass):
         self.checked_by_user_id: int = None
         self.checked: bool = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "CheckListItem":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.name = data.get("name")
-        instance.required = data.get("required")
-        instance.visible_for_clients = data.get("visible_for_clients")
-        instance.checked_at = data.get("checked_at")
-        instance.parameters = data.get("parameters")
-        instance.item_type = data.get("item_type")
-        instance.parent_id = data.get("parent_id")
-        instance.planned_execution_in_hours = data.get("planned_execution_in_hours")
-        instance.position = data.get("position")
-        instance.checked_by_user_id = data.get("checked_by_user_id")
-        instance.checked = data.get("checked")
-        return instance
-
 
 # issues
 
 
-class Issue(types.OkDeskBaseClass):
+class Issue(types.ParametersMixin):
     """
     {
       "id": 153,
@@ -402,6 +377,69 @@ class Issue(types.OkDeskBaseClass):
     }
     """
 
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "created_at",
+        "completed_at",
+        "deadline_at",
+        "source",
+        "spent_time_total",
+        "start_execution_until",
+        "planned_execution_in_hours",
+        "planned_reaction_at",
+        "reacted_at",
+        "updated_at",
+        "delayed_to",
+        "company_id",
+        "group_id",
+        "coexecutors",
+        "service_object_id",
+        "equipment_ids",
+        "attachments",
+        "status_times",
+        "parameters",
+        "comments",
+        "parent_id",
+        "child_ids",
+        "type",
+        "priority",
+        "status",
+        "old_status",
+        "rate",
+        "address",
+        "observers",
+        "observer_groups",
+        "contact",
+        "agreement",
+        "assignee",
+        "author",
+    )
+    _schema = {
+        "created_at": types.Field(datetime=True),
+        "completed_at": types.Field(datetime=True),
+        "deadline_at": types.Field(datetime=True),
+        "start_execution_until": types.Field(datetime=True),
+        "planned_reaction_at": types.Field(datetime=True),
+        "reacted_at": types.Field(datetime=True),
+        "updated_at": types.Field(datetime=True),
+        "delayed_to": types.Field(datetime=True),
+        "coexecutors": types.Field(model=Employee, container="list"),
+        "attachments": types.Field(model=shared.Attachment, container="list"),
+        "status_times": types.Field(model=StatusTime, container="dict"),
+        "type": types.Field(model=IssueType, interned=True),
+        "priority": types.Field(interned=True),
+        "status": types.Field(interned=True),
+        "old_status": types.Field(interned=True),
+        "rate": types.Field(interned=True),
+        "observers": types.Field(interned=True, container="list"),
+        "observer_groups": types.Field(interned=True, container="list"),
+        "contact": types.Field(interned=True),
+        "assignee": types.Field(interned=True),
+        "author": types.Field(interned=True),
+    }
+
     def __init__(self):
         self.id: int = None
         self.title: str = None
@@ -441,82 +479,6 @@ class Issue(types.OkDeskBaseClass):
         self.assignee: types.IdNamePair = None
         self.author: types.IdNamePair = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "Issue":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.title = data.get("title")
-        instance.description = data.get("description")
-        created_at = data.get("created_at")
-        if created_at:
-            instance.created_at = datetime.datetime.fromisoformat(created_at)
-        completed_at = data.get("completed_at")
-        if completed_at:
-            instance.completed_at = datetime.datetime.fromisoformat(completed_at)
-        deadline_at = data.get("deadline_at")
-        if deadline_at:
-            instance.deadline_at = datetime.datetime.fromisoformat(deadline_at)
-        instance.source = data.get("source")
-        instance.spent_time_total = data.get("spent_time_total")
-        start_execution_until = data.get("start_execution_until")
-        if start_execution_until:
-            instance.start_execution_until = datetime.datetime.fromisoformat(
-                start_execution_until
-            )
-        instance.planned_execution_in_hours = data.get("planned_execution_in_hours")
-        planned_reaction_at = data.get("planned_reaction_at")
-        if planned_reaction_at:
-            instance.planned_reaction_at = datetime.datetime.fromisoformat(
-                planned_reaction_at
-            )
-        reacted_at = data.get("reacted_at")
-        if reacted_at:
-            instance.reacted_at = datetime.datetime.fromisoformat(reacted_at)
-        updated_at = data.get("updated_at")
-        if updated_at:
-            instance.updated_at = datetime.datetime.fromisoformat(updated_at)
-        delayed_to = data.get("delayed_to")
-        if delayed_to:
-            instance.delayed_to = datetime.datetime.fromisoformat(delayed_to)
-        instance.company_id = data.get("company_id")
-        instance.group_id = data.get("group_id")
-        coexecutors = data.get("coexecutors")
-        if coexecutors:
-            instance.coexecutors = [
-                Employee.json_parse(coexecutor) for coexecutor in coexecutors
-            ]
-        instance.service_object_id = data.get("service_object_id")
-        instance.equipment_ids = data.get("equipment_ids")
-        attachments = data.get("attachments")
-        if attachments:
-            instance.attachments = [
-                shared.Attachment.json_parse(attachment) for attachment in attachments
-            ]
-        status_times = data.get("status_times")
-        if status_times:
-            instance.status_times = {
-                key: StatusTime.json_parse(value) for key, value in status_times.items()
-            }
-        instance.parameters = data.get("parameters")
-        instance.comments = data.get("comments")
-        instance.parent_id = data.get("parent_id")
-        instance.child_ids = data.get("child_ids")
-        type_ = data.get("type")
-        if type_:
-            instance.type = IssueType.json_parse(type_)
-        instance.priority = data.get("priority")
-        instance.status = data.get("status")
-        instance.old_status = data.get("old_status")
-        instance.rate = data.get("rate")
-        instance.address = data.get("address")
-        instance.observers = data.get("observers")
-        instance.observer_groups = data.get("observer_groups")
-        instance.contact = data.get("contact")
-        instance.agreement = data.get("agreement")
-        instance.assignee = data.get("assignee")
-        instance.author = data.get("author")
-        return instance
-
 
 class CreateIssueRequest(types.ApiRequest):
     """
@@ -586,6 +548,7 @@ class CreateIssueRequest(types.ApiRequest):
         parent_id: typing.Optional[str] = None,
         author: typing.Optional[dict] = None,
         files: typing.Optional[typing.List[types.Attachment]] = None,
+        progress: typing.Optional[helpers.ProgressCallback] = None,
     ):
         """
 
@@ -610,6 +573,7 @@ class CreateIssueRequest(types.ApiRequest):
         :param parent_id: ID of the parent request (ID родительской заявки)
         :param author: author of the request (Автор заявки)
         :param files: files to attach (Прикрепляемые файлы)
+        :param progress: Called with helpers.TransferProgress while files are uploaded (Функция отслеживания прогресса отправки)
         """
 
         self.title: str = title
@@ -640,6 +604,7 @@ class CreateIssueRequest(types.ApiRequest):
         self.author: typing.Optional[dict] = author
 
         self.files: typing.Optional[typing.List[types.Attachment]] = files
+        self.progress: typing.Optional[helpers.ProgressCallback] = progress
 
     def to_request(self) -> dict:
         if not self.files:
@@ -694,93 +659,83 @@ class CreateIssueRequest(types.ApiRequest):
                 "json": {"issue": json_data},
             }
         else:
-            multipart = MultipartEncoder(
-                fields={
-                    "issue[title]": self.title,
-                }
-            )
+            multipart = helpers.MultipartForm(self.progress)
+            multipart.add_field("issue[title]", self.title)
             if self.description:
-                multipart.fields["issue[description]"] = self.description
+                multipart.add_field("issue[description]", self.description)
             if self.company_id:
-                multipart.fields["issue[company_id]"] = self.company_id
+                multipart.add_field("issue[company_id]", self.company_id)
             if self.contact_id:
-                multipart.fields["issue[contact_id]"] = self.contact_id
+                multipart.add_field("issue[contact_id]", self.contact_id)
             if self.agreement_id:
-                multipart.fields["issue[agreement_id]"] = self.agreement_id
+                multipart.add_field("issue[agreement_id]", self.agreement_id)
             if self.assignee_id:
-                multipart.fields["issue[assignee_id]"] = self.assignee_id
+                multipart.add_field("issue[assignee_id]", self.assignee_id)
             if self.group_id:
-                multipart.fields["issue[group_id]"] = self.group_id
+                multipart.add_field("issue[group_id]", self.group_id)
             if self.observer_ids:
-                multipart.fields["issue[observer_ids][]"] = [
-                    str(i) for i in self.observer_ids
-                ]
+                multipart.add_field("issue[observer_ids][]", self.observer_ids)
             if self.observer_group_ids:
-                multipart.fields["issue[observer_group_ids][]"] = [
-                    str(i) for i in self.observer_group_ids
-                ]
+                multipart.add_field(
+                    "issue[observer_group_ids][]", self.observer_group_ids
+                )
             if self.contact_observer_ids:
-                multipart.fields["issue[contact_observer_ids][]"] = [
-                    str(i) for i in self.contact_observer_ids
-                ]
+                multipart.add_field(
+                    "issue[contact_observer_ids][]", self.contact_observer_ids
+                )
             if self.maintenance_entity_id:
-                multipart.fields[
-                    "issue[maintenance_entity_id]"
-                ] = self.maintenance_entity_id
+                multipart.add_field(
+                    "issue[maintenance_entity_id]", self.maintenance_entity_id
+                )
             if self.equipment_ids:
-                multipart.fields["issue[equipment_ids][]"] = [
-                    str(i) for i in self.equipment_ids
-                ]
+                multipart.add_field("issue[equipment_ids][]", self.equipment_ids)
             if self.type:
-                multipart.fields["issue[type]"] = self.type
+                multipart.add_field("issue[type]", self.type)
             if self.priority:
-                multipart.fields["issue[priority]"] = self.priority
+                multipart.add_field("issue[priority]", self.priority)
             if self.deadline_at:
-                multipart.fields["issue[deadline_at]"] = helpers.convert_param(
-                    self.deadline_at
+                multipart.add_field(
+                    "issue[deadline_at]", helpers.convert_param(self.deadline_at)
                 )
             if self.start_execution_until:
-                multipart.fields["issue[start_execution_until]"] = str(
-                    self.start_execution_until
+                multipart.add_field(
+                    "issue[start_execution_until]", str(self.start_execution_until)
                 )
             if self.planned_execution_in_minutes:
-                multipart.fields["issue[planned_execution_in_minutes]"] = str(
-                    self.planned_execution_in_minutes
+                multipart.add_field(
+                    "issue[planned_execution_in_minutes]",
+                    str(self.planned_execution_in_minutes),
                 )
             if self.custom_parameters:
-                multipart.fields["issue[custom_parameters][]"] = [
-                    str(i) for i in self.custom_parameters
-                ]
+                multipart.add_field(
+                    "issue[custom_parameters][]",
+                    [str(i) for i in self.custom_parameters],
+                )
             if self.parent_id:
-                multipart.fields["issue[parent_id]"] = self.parent_id
+                multipart.add_field("issue[parent_id]", self.parent_id)
             if self.author:
-                multipart.fields["issue[author]"] = str(self.author)
+                multipart.add_field("issue[author]", str(self.author))
             for i, file in enumerate(self.files):
                 if "description" in file:
-                    multipart.fields[
-                        f"issue[files_attributes][{i}][description]"
-                    ] = file["description"]
+                    multipart.add_field(
+                        f"issue[files_attributes][{i}][description]",
+                        file["description"],
+                    )
                 if "is_public" in file:
-                    multipart.fields[
-                        f"issue[files_attributes][{i}][is_public]"
-                    ] = helpers.convert_param(file["is_public"])
-                f_name = file["attachment"]
-                if not os.path.isfile(f_name):
-                    raise Exception(f"File {f_name} not found in the filesystem")
-                name = os.path.basename(f_name)
-                mime = mimetypes.guess_type(f_name)[0]
-                multipart.fields[f"issue[files_attributes][{i}][attachment]"] = (
-                    name,
-                    open(f_name, "rb"),
-                    mime,
+                    multipart.add_field(
+                        f"issue[files_attributes][{i}][is_public]",
+                        helpers.convert_param(file["is_public"]),
+                    )
+                multipart.add_file(
+                    f"issue[files_attributes][{i}][attachment]",
+                    file["attachment"],
+                    file.get("filename"),
+                    file.get("content_type"),
                 )
             return {
                 "method": "POST",
                 "url": "api/v1/issues/",
-                "data": multipart.read(),
-                "headers": {
-                    "Content-Type": multipart.content_type,
-                },
+                "data": multipart,
             }
 
     def from_response(self, result) -> int:
@@ -1108,6 +1063,7 @@ class AddCommentRequest(types.ApiRequest):
         author_type: typing.Optional[typing.Literal["employee", "contact"]] = None,
         public: typing.Optional[bool] = None,
         attachments: typing.Optional[typing.List[types.Attachment]] = None,
+        progress: typing.Optional[helpers.ProgressCallback] = None,
     ):
         """
 
@@ -1117,6 +1073,7 @@ class AddCommentRequest(types.ApiRequest):
         :param author_type: User type (Тип пользователя)
         :param public: Public flag (Флаг публичности комментария)
         :param attachments: List of attached files (Список приложенных файлов)
+        :param progress: Called with helpers.TransferProgress while files are uploaded (Функция отслеживания прогресса отправки)
         """
 
         self.issue_id: int = issue_id
@@ -1127,6 +1084,7 @@ class AddCommentRequest(types.ApiRequest):
         ] = author_type
         self.public: typing.Optional[bool] = public
         self.attachments: typing.Optional[typing.List[types.Attachment]] = attachments
+        self.progress: typing.Optional[helpers.ProgressCallback] = progress
 
     def to_request(self) -> dict:
         if self.attachments is None:
@@ -1145,31 +1103,30 @@ class AddCommentRequest(types.ApiRequest):
                 "json": {"comment": json_dict},
             }
         else:
-            multipart = MultipartEncoder({})
-            multipart.fields["comment[content]"] = self.content
+            multipart = helpers.MultipartForm(self.progress)
+            multipart.add_field("comment[content]", self.content)
             if self.author_id is not None:
-                multipart.fields["comment[author_id]"] = self.author_id
+                multipart.add_field("comment[author_id]", self.author_id)
             if self.author_type is not None:
-                multipart.fields["comment[author_type]"] = self.author_type
+                multipart.add_field("comment[author_type]", self.author_type)
             if self.public is not None:
-                multipart.fields["comment[public]"] = self.public
+                multipart.add_field("comment[public]", self.public)
             for i, attachment in enumerate(self.attachments):
-                multipart.fields[f"comment[attachments_attributes][{i}][file]"] = (
-                    os.path.basename(attachment["attachment"]),
-                    open(attachment["attachment"], "rb"),
-                    mimetypes.guess_type(attachment["attachment"])[0],
+                multipart.add_file(
+                    f"comment[attachments_attributes][{i}][file]",
+                    attachment["attachment"],
+                    attachment.get("filename"),
+                    attachment.get("content_type"),
                 )
                 if "description" in attachment:
-                    multipart.fields[
-                        f"comment[attachments_attributes][{i}][description]"
-                    ] = attachment["description"]
+                    multipart.add_field(
+                        f"comment[attachments_attributes][{i}][description]",
+                        attachment["description"],
+                    )
             return {
                 "method": "POST",
                 "url": f"api/v1/issues/{self.issue_id}/comments",
-                "data": multipart.read(),
-                "headers": {
-                    "Content-Type": multipart.content_type,
-                },
+                "data": multipart,
             }
 
     def from_response(self, result) -> Comment:
@@ -1307,6 +1264,8 @@ class GetIssuesListIdRequest(types.ApiRequest):
 
     """
 
+    _parse_options = ("as_id_set",)
+
     def __init__(
         self,
         assignee_ids: typing.Optional[typing.List[int]] = None,
@@ -1341,6 +1300,7 @@ class GetIssuesListIdRequest(types.ApiRequest):
         planned_reaction_since: typing.Optional[datetime.datetime] = None,
         planned_reaction_until: typing.Optional[datetime.datetime] = None,
         custom_parameters: typing.Optional[typing.List[helpers.AttributeFilter]] = None,
+        as_id_set: bool = False,
     ):
         """
 
@@ -1376,6 +1336,7 @@ class GetIssuesListIdRequest(types.ApiRequest):
         :param planned_reaction_since: Datetime of planned reaction since (Дата-время планируемой реакции С)
         :param planned_reaction_until: Datetime of planned reaction until (Дата-время планируемой реакции По)
         :param custom_parameters: Custom parameters (Пользовательские параметры)
+        :param as_id_set: If True, the result is a compact types.IdSet instead of a list (Если True, возвращается types.IdSet вместо списка)
         """
 
         self.assignee_ids: typing.Optional[typing.List[int]] = assignee_ids
@@ -1424,6 +1385,7 @@ class GetIssuesListIdRequest(types.ApiRequest):
         self.custom_parameters: typing.Optional[
             typing.List[helpers.AttributeFilter]
         ] = custom_parameters
+        self.as_id_set: bool = as_id_set
 
     def to_request(self) -> dict:
         params: typing.Dict[str, typing.Union[str, typing.List[str]]] = {}
@@ -1503,7 +1465,9 @@ class GetIssuesListIdRequest(types.ApiRequest):
             "params": params,
         }
 
-    def from_response(self, result) -> typing.List[int]:
+    def from_response(self, result) -> typing.Union[typing.List[int], types.IdSet]:
+        if self.as_id_set:
+            return types.IdSet(result)
         return result
 
 
@@ -1564,6 +1528,8 @@ class GetIssuesListRichRequest(types.ApiRequest):
     Пример: sorting[direction]=reverse
     """
 
+    _parse_options = ("fields", "lazy")
+
     def __init__(
         self,
         company_ids: typing.Optional[typing.List[int]] = None,
@@ -1582,6 +1548,8 @@ class GetIssuesListRichRequest(types.ApiRequest):
             typing.Literal["created_at", "updated_at"]
         ] = None,
         sorting_direction: typing.Optional[typing.Literal["reverse", "forward"]] = None,
+        lazy: bool = False,
+        fields: typing.Optional[typing.List[str]] = None,
     ):
         """
 
@@ -1599,6 +1567,8 @@ class GetIssuesListRichRequest(types.ApiRequest):
         :param page_size: Number of elements per page (Количество элементов на странице)
         :param sorting_field: Sorting field (Поле сортировки)
         :param sorting_direction: Sorting direction (Направление сортировки)
+        :param lazy: If True, returns lazy models, which parse fields on first access (Если True, поля разбираются при первом обращении)
+        :param fields: If set, returns lightweight records with only these fields, e.g. ["id", "updated_at", "status.code"] (Если задано, возвращаются записи только с этими полями)
         """
         self.company_ids: typing.Optional[typing.List[int]] = company_ids
         self.contact_ids: typing.Optional[typing.List[int]] = contact_ids
@@ -1620,6 +1590,8 @@ class GetIssuesListRichRequest(types.ApiRequest):
         self.sorting_direction: typing.Optional[
             typing.Literal["reverse", "forward"]
         ] = sorting_direction
+        self.lazy: bool = lazy
+        self.fields: typing.Optional[typing.List[str]] = fields
 
     def to_request(self) -> dict:
         params: typing.Dict[str, typing.Union[str, typing.List[str]]] = {}
@@ -1667,7 +1639,10 @@ class GetIssuesListRichRequest(types.ApiRequest):
         }
 
     def from_response(self, result) -> typing.List[Issue]:
-        return [Issue.json_parse(issue) for issue in result]
+        if self.fields:
+            return [Issue.json_project(issue, self.fields) for issue in result]
+        parse = Issue.json_parse_lazy if self.lazy else Issue.json_parse
+        return [parse(issue) for issue in result]
 
 
 class PostRatingIssueRequest(types.ApiRequest):
@@ -2075,6 +2050,7 @@ class MarkCheckedChecklistItemIssueRequest(types.ApiRequest):
         checked: bool,
         item_parameters: dict = None,
         attachment: str = None,
+        progress: typing.Optional[helpers.ProgressCallback] = None,
     ):
         """
 
@@ -2083,12 +2059,14 @@ class MarkCheckedChecklistItemIssueRequest(types.ApiRequest):
         :param checked: Checked (Признак выполненности)
         :param item_parameters: Item parameters (Параметры строки чек-листа)
         :param attachment: Attachment (Прикрепляемый файл)
+        :param progress: Called with helpers.TransferProgress while files are uploaded (Функция отслеживания прогресса отправки)
         """
         self.issue_id: int = issue_id
         self.item_id: int = item_id
         self.checked: bool = checked
         self.item_parameters: dict = item_parameters
         self.attachment: str = attachment
+        self.progress: typing.Optional[helpers.ProgressCallback] = progress
 
     def to_request(self) -> dict:
         if self.attachment is None:
@@ -2103,29 +2081,21 @@ class MarkCheckedChecklistItemIssueRequest(types.ApiRequest):
                 "json": {"check_list_item": json_data},
             }
         else:
-            multipart_data = MultipartEncoder({})
-            multipart_data.fields["check_list_item[checked]"] = str(
-                self.checked
-            ).lower()
+            multipart_data = helpers.MultipartForm(self.progress)
+            multipart_data.add_field("check_list_item[checked]", self.checked)
             if self.item_parameters is not None:
                 for key, value in self.item_parameters.items():
-                    multipart_data.fields[
-                        f"check_list_item[item_parameters][{key}]"
-                    ] = value
-            multipart_data.fields[
-                "check_list_item[item_parameters][files][0][attachment]"
-            ] = (
-                os.path.basename(self.attachment),
-                open(self.attachment, "rb"),
-                mimetypes.guess_type(self.attachment)[0],
+                    multipart_data.add_field(
+                        f"check_list_item[item_parameters][{key}]", value
+                    )
+            multipart_data.add_file(
+                "check_list_item[item_parameters][files][0][attachment]",
+                self.attachment,
             )
             return {
                 "method": "PATCH",
                 "url": f"api/v1/issues/{self.issue_id}/check_lists/items/{self.item_id}/check",
-                "data": multipart_data.read(),
-                "headers": {
-                    "Content-Type": multipart_data.content_type,
-                },
+                "data": multipart_data,
             }
 
     def from_response(self, result) -> typing.List[CheckListItem]:
@@ -2143,12 +2113,16 @@ class GetIssueRequest(types.ApiRequest):
 
     """
 
-    def __init__(self, issue_id: int):
+    _parse_options = ("lazy",)
+
+    def __init__(self, issue_id: int, lazy: bool = False):
         """
 
         :param issue_id: Id of the issue (ID заявки)
+        :param lazy: If True, returns a lazy model, which parses fields on first access (Если True, поля разбираются при первом обращении)
         """
         self.issue_id: int = issue_id
+        self.lazy: bool = lazy
 
     def to_request(self) -> dict:
         return {
@@ -2157,6 +2131,8 @@ class GetIssueRequest(types.ApiRequest):
         }
 
     def from_response(self, result) -> Issue:
+        if self.lazy:
+            return Issue.json_parse_lazy(result)
         return Issue.json_parse(result)
 
 
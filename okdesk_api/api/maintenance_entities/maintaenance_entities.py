@@ -1,14 +1,12 @@
 # maintenance entities
 import datetime
-import os.path
 import typing
-from requests_toolbelt import MultipartEncoder
-import mimetypes
+from ... import helpers
 from ... import types
 from .. import shared
 
 
-class MaintanceEntity(types.OkDeskBaseClass):
+class MaintanceEntity(types.ParametersMixin):
     """
     {
         "id": 1,
@@ -120,6 +118,27 @@ class MaintanceEntity(types.OkDeskBaseClass):
       }
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "address",
+        "comment",
+        "default_assignee_id",
+        "default_assignee_group_id",
+        "company_id",
+        "timezone",
+        "contacts_ids",
+        "equipments_ids",
+        "coordinates",
+        "parameters",
+        "schedule",
+        "observers",
+        "observer_groups",
+        "attachments",
+        "agreements",
+    )
+    _schema = {"attachments": types.Field(model=shared.Attachment, container="list")}
+
     def __init__(self):
         self.id: int = None
         self.name: str = None
@@ -139,32 +158,6 @@ class MaintanceEntity(types.OkDeskBaseClass):
         self.attachments: typing.List[shared.Attachment] = None
         self.agreements: typing.List[types.IdNamePair] = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "MaintanceEntity":
-        result = cls()
-        result.id = data.get("id")
-        result.name = data.get("name")
-        result.address = data.get("address")
-        result.comment = data.get("comment")
-        result.default_assignee_id = data.get("default_assignee_id")
-        result.default_assignee_group_id = data.get("default_assignee_group_id")
-        result.company_id = data.get("company_id")
-        result.timezone = data.get("timezone")
-        result.contacts_ids = data.get("contacts_ids")
-        result.equipments_ids = data.get("equipments_ids")
-        result.coordinates = data.get("coordinates")
-        result.parameters = data.get("parameters")
-        result.schedule = data.get("schedule")
-        result.observers = data.get("observers")
-        result.observer_groups = data.get("observer_groups")
-        result.attachments = []
-        for attachment in data.get("attachments", []):
-            result.attachments.append(shared.Attachment.json_parse(attachment))
-        if not result.attachments:
-            result.attachments = None
-        result.agreements = data.get("agreements")
-        return result
-
 
 class CreateMaintenanceEntityRequest(types.ApiRequest):
     """
@@ -503,6 +496,8 @@ class ListMaintenanceEntitiesRequest(types.ApiRequest):
 
     """
 
+    _parse_options = ("lazy",)
+
     def __init__(
         self,
         company_ids: typing.Optional[typing.List[int]] = None,
@@ -515,6 +510,7 @@ class ListMaintenanceEntitiesRequest(types.ApiRequest):
         page_size: typing.Optional[int] = None,
         page_from_id: typing.Optional[int] = None,
         page_direction: typing.Optional[typing.Literal["reverse", "forward"]] = None,
+        lazy: bool = False,
     ):
         """
 
@@ -528,6 +524,7 @@ class ListMaintenanceEntitiesRequest(types.ApiRequest):
         :param page_size: Page size (Число возвращаемых записей)
         :param page_from_id: Page from id (D объекта обслуживания, с которого начинается выборка записей)
         :param page_direction: Page direction (Направление выборки)
+        :param lazy: If True, returns lazy models, which parse fields on first access (Если True, поля разбираются при первом обращении)
         """
 
         self.company_ids: typing.Optional[typing.List[int]] = company_ids
@@ -546,6 +543,7 @@ class ListMaintenanceEntitiesRequest(types.ApiRequest):
         self.page_direction: typing.Optional[
             typing.Literal["reverse", "forward"]
         ] = page_direction
+        self.lazy: bool = lazy
 
     def to_request(
         self,
@@ -584,7 +582,10 @@ class ListMaintenanceEntitiesRequest(types.ApiRequest):
         }
 
     def from_response(self, result) -> typing.List[MaintanceEntity]:
-        return [MaintanceEntity.json_parse(item) for item in result]
+        parse = (
+            MaintanceEntity.json_parse_lazy if self.lazy else MaintanceEntity.json_parse
+        )
+        return [parse(item) for item in result]
 
 
 class AddMaintenanceEntityAttachmentRequest(types.ApiRequest):
@@ -596,40 +597,45 @@ class AddMaintenanceEntityAttachmentRequest(types.ApiRequest):
     """
 
     def __init__(
-        self, maintenance_entity_id: int, attachments: typing.List[types.Attachment]
+        self,
+        maintenance_entity_id: int,
+        attachments: typing.List[types.Attachment],
+        progress: typing.Optional[helpers.ProgressCallback] = None,
     ):
         """
 
         :param maintenance_entity_id: Maintenance entity ID (ID объекта обслуживания)
         :param attachments:  (Список приложенных файлов)
+        :param progress: Called with helpers.TransferProgress while files are uploaded (Функция отслеживания прогресса отправки)
         """
         self.maintenance_entity_id = maintenance_entity_id
         self.attachments: typing.List[types.Attachment] = attachments
+        self.progress: typing.Optional[helpers.ProgressCallback] = progress
 
     def to_request(self) -> dict:
-        multipart_data = MultipartEncoder({})
+        multipart_data = helpers.MultipartForm(self.progress)
         for i, attachment in enumerate(self.attachments):
-            if not os.path.isfile(attachment["attachment"]):
-                raise Exception("File not found")
-            file_name = os.path.basename(attachment["attachment"])
-            content_type = mimetypes.guess_type(file_name)[0]
-            multipart_data.fields[
-                f"maintenance_entity[attachments][{i}][attachment]"
-            ] = (file_name, open(attachment["attachment"], "rb"), content_type)
+            multipart_data.add_file(
+                f"maintenance_entity[attachments][{i}][attachment]",
+                attachment["attachment"],
+                attachment.get("filename"),
+                attachment.get("content_type"),
+            )
             if "is_public" in attachment:
-                multipart_data.fields[
-                    f"maintenance_entity[attachments][{i}][is_public]"
-                ] = attachment["is_public"]
+                multipart_data.add_field(
+                    f"maintenance_entity[attachments][{i}][is_public]",
+                    attachment["is_public"],
+                )
             if "description" in attachment:
-                multipart_data.fields[
-                    f"maintenance_entity[attachments][{i}][description]"
-                ] = attachment["description"]
+                multipart_data.add_field(
+                    f"maintenance_entity[attachments][{i}][description]",
+                    attachment["description"],
+                )
 
         return {
             "method": "POST",
             "url": f"api/v1/maintenance_entities/{self.maintenance_entity_id}/attachments/",
-            "data": multipart_data.read(),
-            "headers": {"Content-Type": multipart_data.content_type},
+            "data": multipart_data,
         }
 
     def from_response(self, result) -> MaintanceEntity:
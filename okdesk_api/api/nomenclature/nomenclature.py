@@ -30,6 +30,13 @@ class Group(types.OkDeskBaseClass):
 
     """
 
+    __slots__ = ("id", "code", "name", "active", "group_id", "group_code", "group_name")
+    _schema = {
+        "group_id": types.Field(source="group.id"),
+        "group_code": types.Field(source="group.code"),
+        "group_name": types.Field(source="group.name"),
+    }
+
     def __init__(self):
         self.id: int = None
         self.code: str = None
@@ -40,20 +47,6 @@ class Group(types.OkDeskBaseClass):
         self.group_code: typing.Optional[str] = None
         self.group_name: typing.Optional[str] = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "Group":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.code = data.get("code")
-        instance.name = data.get("name")
-        instance.active = data.get("active")
-        group = data.get("group", None)
-        if group:
-            instance.group_id = group.get("id")
-            instance.group_code = group.get("code")
-            instance.group_name = group.get("name")
-        return instance
-
 
 class Position(types.OkDeskBaseClass):
     """
@@ -88,6 +81,25 @@ class Position(types.OkDeskBaseClass):
 
     """
 
+    __slots__ = (
+        "id",
+        "code",
+        "name",
+        "active",
+        "item_type",
+        "unit",
+        "vendor_code",
+        "description",
+        "group_id",
+        "group_code",
+        "group_name",
+    )
+    _schema = {
+        "group_id": types.Field(source="group.id"),
+        "group_code": types.Field(source="group.code"),
+        "group_name": types.Field(source="group.name"),
+    }
+
     def __init__(self):
         self.id: int = None
         self.code: str = None
@@ -102,24 +114,6 @@ class Position(types.OkDeskBaseClass):
         self.group_code: typing.Optional[str] = None
         self.group_name: typing.Optional[str] = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "Position":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.code = data.get("code")
-        instance.name = data.get("name")
-        instance.active = data.get("active")
-        instance.item_type = data.get("item_type")
-        instance.unit = data.get("unit")
-        instance.vendor_code = data.get("vendor_code")
-        instance.description = data.get("description")
-        group = data.get("group", None)
-        if group:
-            instance.group_id = group.get("id")
-            instance.group_code = group.get("code")
-            instance.group_name = group.get("name")
-        return instance
-
 
 class GetGroupsRequest(types.ApiRequest):
     """
@@ -532,6 +526,21 @@ class PriceListService(types.OkDeskBaseClass):
     }
     """
 
+    __slots__ = (
+        "id",
+        "nomenclature_item_id",
+        "code",
+        "name",
+        "type",
+        "group",
+        "unit",
+        "vendor_code",
+        "price",
+        "nds",
+        "visible",
+        "description",
+    )
+
     def __init__(self):
         self.id: int = None
         self.nomenclature_item_id: int = None
@@ -546,23 +555,6 @@ class PriceListService(types.OkDeskBaseClass):
         self.visible: bool = None
         self.description: str = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "PriceListService":
-        obj = cls()
-        obj.id = data.get("id")
-        obj.nomenclature_item_id = data.get("nomenclature_item_id")
-        obj.code = data.get("code")
-        obj.name = data.get("name")
-        obj.type = data.get("type")
-        obj.group = data.get("group")
-        obj.unit = data.get("unit")
-        obj.vendor_code = data.get("vendor_code")
-        obj.price = data.get("price")
-        obj.nds = data.get("nds")
-        obj.visible = data.get("visible")
-        obj.description = data.get("description")
-        return obj
-
 
 class GetPriceListServicesRequest(types.ApiRequest):
     """
@@ -32,6 +32,15 @@ class PriceList(types.OkDeskBaseClass):
      }
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "allow_without_category",
+        "allow_without_company",
+        "company_category_codes",
+        "company_ids",
+    )
+
     def __init__(self):
         self.id: int = None
         self.name: str = None
@@ -40,17 +49,6 @@ class PriceList(types.OkDeskBaseClass):
         self.company_category_codes: typing.List[str] = None
         self.company_ids: typing.List[int] = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "PriceList":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.name = data.get("name")
-        instance.allow_without_category = data.get("allow_without_category")
-        instance.allow_without_company = data.get("allow_without_company")
-        instance.company_category_codes = data.get("company_category_codes")
-        instance.company_ids = data.get("company_ids")
-        return instance
-
 
 class Service(types.OkDeskBaseClass):
     """
@@ -67,6 +65,18 @@ class Service(types.OkDeskBaseClass):
     }
     """
 
+    __slots__ = (
+        "id",
+        "code",
+        "name",
+        "type",
+        "unit",
+        "price",
+        "nds",
+        "visible",
+        "description",
+    )
+
     def __init__(self):
         self.id: int = None
         self.code: str = None
@@ -78,20 +88,6 @@ class Service(types.OkDeskBaseClass):
         self.visible: bool = None
         self.description: str = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "Service":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.code = data.get("code")
-        instance.name = data.get("name")
-        instance.type = data.get("type")
-        instance.unit = data.get("unit")
-        instance.price = data.get("price")
-        instance.nds = data.get("nds")
-        instance.visible = data.get("visible")
-        instance.description = data.get("description")
-        return instance
-
 
 class ServiceWithPriceList(types.OkDeskBaseClass):
     """
@@ -109,6 +105,19 @@ class ServiceWithPriceList(types.OkDeskBaseClass):
     }
     """
 
+    __slots__ = (
+        "price_list_id",
+        "price_list_name",
+        "id",
+        "code",
+        "name",
+        "type",
+        "unit",
+        "price",
+        "nds",
+        "description",
+    )
+
     def __init__(self):
         self.price_list_id: int = None
         self.price_list_name: str = None
@@ -121,21 +130,6 @@ class ServiceWithPriceList(types.OkDeskBaseClass):
         self.nds: float = None
         self.description: str = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "ServiceWithPriceList":
-        instance = cls()
-        instance.price_list_id = data.get("price_list_id")
-        instance.price_list_name = data.get("price_list_name")
-        instance.id = data.get("id")
-        instance.code = data.get("code")
-        instance.name = data.get("name")
-        instance.type = data.get("type")
-        instance.unit = data.get("unit")
-        instance.price = data.get("price")
-        instance.nds = data.get("nds")
-        instance.description = data.get("description")
-        return instance
-
 
 class GetPriceListListRequest(types.ApiRequest):
     """
@@ -16,6 +16,8 @@ class EquipmentManufacturer(types.OkDeskBaseClass):
       },
     """
 
+    __slots__ = ("id", "code", "name", "description", "visible")
+
     def __init__(self):
         self.id: int = None
         self.code: str = None
@@ -23,16 +25,6 @@ class EquipmentManufacturer(types.OkDeskBaseClass):
         self.description: str = None
         self.visible: bool = None
 
-    @classmethod
-    def json_parse(cls, data: dict) -> "EquipmentManufacturer":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.code = data.get("code")
-        instance.name = data.get("name")
-        instance.description = data.get("description")
-        instance.visible = data.get("visible")
-        return instance
-
 
 class GetManufacturersRequest(types.ApiRequest):
     """
@@ -214,6 +206,16 @@ class EquipmentModel(types.OkDeskBaseClass):
       }
     """
 
+    __slots__ = (
+        "id",
+        "code",
+        "name",
+        "description",
+        "visible",
+        "equipment_kind",
+        "equipment_manufacturer",
+    )
+
     def __init__(self):
         self.id: int = None
         self.code: str = None
@@ -223,18 +225,6 @@ class EquipmentModel(types.OkDeskBaseClass):
         self.equipment_kind: typing.Optional[types.CodeIdNamePair] = None
         self.equipment_manufacturer: typing.Optional[types.CodeIdNamePair] = None
 
-    @classmethod
-    def json_parse(cls, json_data) -> "EquipmentModel":
-        result = cls()
-        result.id = json_data.get("id")
-        result.code = json_data.get("code")
-        result.name = json_data.get("name")
-        result.description = json_data.get("description")
-        result.visible = json_data.get("visible")
-        result.equipment_kind = json_data.get("equipment_kind")
-        result.equipment_manufacturer = json_data.get("equipment_manufacturer")
-        return result
-
 
 class GetEquipmentModelsRequest(types.ApiRequest):
     """
@@ -436,6 +426,8 @@ class EquipmentKind(types.OkDeskBaseClass):
     }
     """
 
+    __slots__ = ("id", "code", "name", "description", "visible", "parameters")
+
     def __init__(self):
         self.id: int = None
         self.code: str = None
@@ -444,17 +436,6 @@ class EquipmentKind(types.OkDeskBaseClass):
         self.visible: bool = None
         self.parameters: typing.List[dict] = None
 
-    @classmethod
-    def json_parse(cls, json_data: dict) -> "EquipmentKind":
-        instance = cls()
-        instance.id = json_data.get("id")
-        instance.code = json_data.get("code")
-        instance.name = json_data.get("name")
-        instance.description = json_data.get("description")
-        instance.visible = json_data.get("visible")
-        instance.parameters = json_data.get("parameters")
-        return instance
-
 
 class GetEquipmentKindsRequest(types.ApiRequest):
     """
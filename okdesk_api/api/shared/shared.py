@@ -22,6 +22,17 @@ class Attachment(types.OkDeskBaseClass):
     }
     """
 
+    __slots__ = (
+        "id",
+        "description",
+        "is_public",
+        "attachment_file_name",
+        "attachment_file_size",
+        "created_at",
+        "attachment_url",
+    )
+    _schema = {"created_at": types.Field(datetime=True)}
+
     def __init__(self):
         self.id: int = None
         self.description: str = None
@@ -30,17 +41,3 @@ class Attachment(types.OkDeskBaseClass):
         self.attachment_file_size: typing.Optional[int] = None
         self.created_at: typing.Optional[datetime.datetime] = None
         self.attachment_url: typing.Optional[str] = None
-
-    @classmethod
-    def json_parse(cls, data: dict) -> "Attachment":
-        instance = cls()
-        instance.id = data.get("id")
-        instance.attachment_file_name = data.get("attachment_file_name")
-        instance.description = data.get("description")
-        instance.attachment_file_size = data.get("attachment_file_size")
-        instance.is_public = data.get("is_public")
-        created_at = data.get("created_at")
-        if created_at:
-            instance.created_at = datetime.datetime.fromisoformat(created_at)
-        instance.attachment_url = data.get("attachment_url")
-        return instance
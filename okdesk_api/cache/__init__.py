@@ -0,0 +1,11 @@
+from .attachments import AttachmentCache
+from .references import ReferenceCache, ReferenceTable
+from .responses import CachedResponse, ResponseCache
+
+__all__ = [
+    "AttachmentCache",
+    "CachedResponse",
+    "ReferenceCache",
+    "ReferenceTable",
+    "ResponseCache",
+]
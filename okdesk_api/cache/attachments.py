@@ -0,0 +1,205 @@
+import asyncio
+import collections
+import os
+import typing
+
+from ..client import downloads
+
+# total size of cached files, bytes
+DEFAULT_MAX_SIZE = 2**30
+
+
+class AttachmentCache:
+    """
+    Local disk cache of attachment contents, keyed by attachment id and attachment_file_size.
+    Files are stored as "<directory>/<id % 256 in hex>/<id>-<size>", so the layout is stable
+    between runs and processes. When the total size exceeds `max_size`, least recently used
+    files are removed.
+    (Локальный кэш содержимого вложений на диске по ID и размеру вложения.
+    При превышении max_size удаляются давно не использованные файлы.)
+
+    >>> cache = AttachmentCache("/var/cache/okdesk", max_size=10 * 2**30)
+    >>> path = await cache.download(client, await client.get_file_of_issue(issue_id, attachment_id))
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        :param directory: Cache directory, created if missing (Каталог кэша)
+        :param max_size: Max total size of cached files in bytes (Максимальный размер кэша в байтах)
+        """
+        if max_size < 0:
+            raise ValueError("max_size must be >= 0")
+        self.directory = directory
+        self.max_size = max_size
+        # path -> size, least recently used first. Loaded from the directory on the first use
+        self._index: typing.Optional[typing.OrderedDict[str, int]] = None
+        self._total_size = 0
+        self._downloads: typing.Dict[str, asyncio.Future] = {}
+
+    def path(self, attachment) -> str:
+        """
+        Returns path of the attachment in the cache, the file may be missing.
+        (Возвращает путь к вложению в кэше.)
+
+        :param attachment: shared.Attachment with id and attachment_file_size
+        """
+        if attachment.id is None or attachment.attachment_file_size is None:
+            raise ValueError("attachment id and attachment_file_size are required")
+        return os.path.join(
+            self.directory,
+            f"{attachment.id % 256:02x}",
+            f"{attachment.id}-{attachment.attachment_file_size}",
+        )
+
+    @property
+    def size(self) -> int:
+        """Total size of cached files, known to this instance (Размер кэша в байтах)"""
+        return self._total_size
+
+    async def get(self, attachment) -> typing.Optional[str]:
+        """
+        Returns path of the cached attachment and marks it as recently used, or None if it is not cached.
+        (Возвращает путь к вложению в кэше или None, если его нет.)
+        """
+        await self._load()
+        path = self.path(attachment)
+        if path not in self._index:
+            return None
+        if not await _run(_touch, path):
+            # removed by another process
+            self._forget(path)
+            return None
+        self._index.move_to_end(path)
+        return path
+
+    async def download(self, client, attachment) -> str:
+        """
+        Returns path of the cached attachment, downloading it with client.download_attachment
+        if it is not cached yet. Simultaneous calls for the same attachment download it once.
+        (Возвращает путь к вложению в кэше, загружая его при отсутствии.)
+
+        :param client: OkDeskClient
+        :param attachment: shared.Attachment with attachment_url (Вложение)
+        """
+        path = await self.get(attachment)
+        if path is not None:
+            return path
+        path = self.path(attachment)
+        future = self._downloads.get(path)
+        if future is None:
+            future = asyncio.ensure_future(self._download(client, attachment, path))
+            self._downloads[path] = future
+            future.add_done_callback(lambda _: self._downloads.pop(path, None))
+        return await asyncio.shield(future)
+
+    async def download_many(
+        self, client, attachments: typing.Iterable, max_concurrency: int = 8
+    ) -> typing.List[str]:
+        """
+        Downloads attachments into the cache, at most `max_concurrency` at the same time.
+        (Загружает вложения в кэш, не более max_concurrency одновременно.)
+
+        :return: Paths in the order of attachments (Пути в порядке вложений)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def download(attachment) -> str:
+            async with semaphore:
+                return await self.download(client, attachment)
+
+        return await asyncio.gather(
+            *(download(attachment) for attachment in attachments)
+        )
+
+    async def _download(self, client, attachment, path: str) -> str:
+        await _run(os.makedirs, os.path.dirname(path), 0o777, True)
+        await client.download_attachment(attachment, path)
+        self._add(path, attachment.attachment_file_size)
+        await self._evict(keep=path)
+        return path
+
+    async def evict(self):
+        """
+        Removes least recently used files until the cache fits into max_size.
+        (Удаляет давно не использованные файлы, пока кэш не уложится в max_size.)
+        """
+        await self._load()
+        await self._evict()
+
+    async def clear(self):
+        """Removes all cached files (Удаляет все файлы кэша)"""
+        await self._load()
+        paths = list(self._index)
+        self._index.clear()
+        self._total_size = 0
+        await _run(_remove_files, paths)
+
+    async def _evict(self, keep: typing.Optional[str] = None):
+        removed = []
+        for path in list(self._index):
+            if self._total_size <= self.max_size:
+                break
+            if path != keep:
+                self._forget(path)
+                removed.append(path)
+        if removed:
+            await _run(_remove_files, removed)
+
+    def _add(self, path: str, size: int):
+        if path in self._index:
+            self._index.move_to_end(path)
+            return
+        self._index[path] = size
+        self._total_size += size
+
+    def _forget(self, path: str):
+        self._total_size -= self._index.pop(path, 0)
+
+    async def _load(self):
+        if self._index is not None:
+            return
+        files = await _run(_scan, self.directory)
+        index = collections.OrderedDict()
+        for path, size in files:
+            index[path] = size
+        self._index = index
+        self._total_size = sum(index.values())
+
+
+async def _run(function, *args):
+    return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+
+def _scan(directory: str) -> typing.List[typing.Tuple[str, int]]:
+    # cached files ordered by modification time, which is updated on every use
+    files = []
+    if not os.path.isdir(directory):
+        return files
+    for bucket in os.scandir(directory):
+        if not bucket.is_dir():
+            continue
+        for entry in os.scandir(bucket.path):
+            if entry.name.endswith(downloads.PART_SUFFIX) or not entry.is_file():
+                continue
+            stat = entry.stat()
+            files.append((stat.st_mtime, entry.path, stat.st_size))
+    files.sort()
+    return [(path, size) for _, path, size in files]
+
+
+def _touch(path: str) -> bool:
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _remove_files(paths: typing.List[str]):
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
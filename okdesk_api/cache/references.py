@@ -0,0 +1,242 @@
+import asyncio
+import time
+import typing
+from warnings import warn
+
+from ..api import nomenclature, price_lists, references
+
+# page[size] limit of the API
+PAGE_SIZE = 100
+
+# name -> function(page_size, from_id), creating request for the next page in forward direction
+_SOURCES: typing.Dict[str, typing.Callable[[int, typing.Optional[int]], typing.Any]] = {
+    "manufacturers": lambda size, from_id: references.GetManufacturersRequest(
+        page_size=size, page_from_id=from_id, page_direction="forward"
+    ),
+    "equipment_models": lambda size, from_id: references.GetEquipmentModelsRequest(
+        page_size=size, page_from_id=from_id, page_direction="forward"
+    ),
+    "equipment_kinds": lambda size, from_id: references.GetEquipmentKindsRequest(
+        page_size=size, page_from_id=from_id, page_direction="forward"
+    ),
+    "price_lists": lambda size, from_id: price_lists.GetPriceListListRequest(
+        size=size, from_id=from_id, direction="forward"
+    ),
+    "nomenclature_groups": lambda size, from_id: nomenclature.GetGroupsRequest(
+        page_size=size, page_from_id=from_id, page_direction="forward"
+    ),
+}
+
+
+def _normalize_name(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+class ReferenceTable:
+    """
+    Loaded reference items with indexes by id, code and name. Names are compared case-insensitively,
+    ignoring repeated whitespace, and may repeat: equipment models of different manufacturers
+    can have the same name, so equipment models are also indexed by (manufacturer id, name).
+    A table is not changed after creation, refresh replaces it.
+    (Загруженный справочник с индексами по ID, коду и названию. Названия могут повторяться.)
+    """
+
+    __slots__ = (
+        "name",
+        "items",
+        "by_id",
+        "by_code",
+        "by_name",
+        "by_manufacturer_name",
+        "loaded_at",
+    )
+
+    def __init__(self, name: str, items: typing.List[typing.Any]):
+        self.name = name
+        self.items = items
+        self.by_id: typing.Dict[int, typing.Any] = {}
+        self.by_code: typing.Dict[str, typing.Any] = {}
+        # normalized name -> items with this name
+        self.by_name: typing.Dict[str, typing.List[typing.Any]] = {}
+        # (manufacturer id, normalized name) -> items, for equipment models
+        self.by_manufacturer_name: typing.Dict[
+            typing.Tuple[int, str], typing.List[typing.Any]
+        ] = {}
+        for item in items:
+            self.by_id[item.id] = item
+            code = getattr(item, "code", None)
+            if code:
+                self.by_code.setdefault(code, item)
+            if not item.name:
+                continue
+            key = _normalize_name(item.name)
+            self.by_name.setdefault(key, []).append(item)
+            manufacturer = getattr(item, "equipment_manufacturer", None)
+            if manufacturer and manufacturer.get("id") is not None:
+                self.by_manufacturer_name.setdefault(
+                    (manufacturer["id"], key), []
+                ).append(item)
+        # time.monotonic() of the load
+        self.loaded_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __repr__(self):
+        return f"ReferenceTable(name={self.name!r}, size={len(self.items)})"
+
+    def get(self, item_id: int, default=None):
+        """Returns item by id (Возвращает элемент по ID)"""
+        return self.by_id.get(item_id, default)
+
+    def get_by_code(self, code: str, default=None):
+        """Returns item by code (Возвращает элемент по коду)"""
+        return self.by_code.get(code, default)
+
+    def find_by_name(
+        self, name: str, manufacturer_id: typing.Optional[int] = None
+    ) -> typing.List[typing.Any]:
+        """
+        Returns all items with the name, of the manufacturer if manufacturer_id is set (equipment models).
+        (Возвращает все элементы с таким названием, для моделей - с учетом производителя.)
+        """
+        key = _normalize_name(name)
+        if manufacturer_id is None:
+            return list(self.by_name.get(key, ()))
+        return list(self.by_manufacturer_name.get((manufacturer_id, key), ()))
+
+    def get_by_name(
+        self, name: str, default=None, manufacturer_id: typing.Optional[int] = None
+    ):
+        """
+        Returns the only item with the name, of the manufacturer if manufacturer_id is set (equipment models).
+        (Возвращает единственный элемент с таким названием.)
+
+        :raises LookupError: if several items have the name (если таких элементов несколько)
+        """
+        items = self.find_by_name(name, manufacturer_id)
+        if not items:
+            return default
+        if len(items) > 1:
+            raise LookupError(
+                f"{len(items)} items of {self.name} are named {name!r}: "
+                f"{', '.join(str(item.id) for item in items)}"
+            )
+        return items[0]
+
+
+class ReferenceCache:
+    """
+    Preloaded reference data: manufacturers, equipment_models, equipment_kinds, price_lists and
+    nomenclature_groups. Every reference is loaded completely with pagination and refreshed in the
+    background every `ttl` seconds. If a refresh fails, previous data is kept.
+    (Предзагруженные справочники с фоновым обновлением раз в ttl секунд.)
+
+    >>> async with ReferenceCache(client, ttl=3600) as cache:
+    ...     manufacturer = cache.manufacturers.get_by_name("Hewlett-Packard")
+    ...     model = cache.equipment_models.get_by_name("Model X", manufacturer_id=manufacturer.id)
+    """
+
+    REFERENCES = tuple(_SOURCES)
+
+    def __init__(
+        self,
+        client,
+        ttl: typing.Optional[float] = 3600,
+        references: typing.Iterable[str] = REFERENCES,
+        page_size: int = PAGE_SIZE,
+    ):
+        """
+        :param client: OkDeskClient
+        :param ttl: Seconds between refreshes, None disables background refresh (Период обновления в секундах)
+        :param references: Names of references to load (Названия загружаемых справочников)
+        :param page_size: Page size, not more than 100 (Размер страницы, не более 100)
+        """
+        references = tuple(references)
+        unknown = set(references) - set(_SOURCES)
+        if unknown:
+            raise ValueError(f"Unknown references: {', '.join(sorted(unknown))}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        if not 0 < page_size <= PAGE_SIZE:
+            raise ValueError(f"page_size must be in 1..{PAGE_SIZE}")
+        self.client = client
+        self.ttl = ttl
+        self.references = references
+        self.page_size = page_size
+        self._tables: typing.Dict[str, ReferenceTable] = {}
+        self._refresh_task: typing.Optional[asyncio.Task] = None
+
+    def __getattr__(self, name: str) -> ReferenceTable:
+        # cache.manufacturers, cache.equipment_models, ...
+        if name in _SOURCES:
+            try:
+                return self._tables[name]
+            except KeyError:
+                raise LookupError(
+                    f"Reference {name} is not loaded, call warmup() first"
+                ) from None
+        raise AttributeError(name)
+
+    def __getitem__(self, name: str) -> ReferenceTable:
+        return self.__getattr__(name)
+
+    async def __aenter__(self) -> "ReferenceCache":
+        await self.warmup()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def warmup(self):
+        """
+        Loads all references concurrently and starts background refresh.
+        (Загружает все справочники и запускает фоновое обновление.)
+        """
+        await self.refresh()
+        if self.ttl is not None and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def refresh(self, *names: str):
+        """
+        Reloads references (all by default) now. (Перезагружает справочники.)
+        """
+        names = names or self.references
+        tables = await asyncio.gather(*(self._load(name) for name in names))
+        for table in tables:
+            self._tables[table.name] = table
+
+    async def close(self):
+        """Stops background refresh (Останавливает фоновое обновление)"""
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _load(self, name: str) -> ReferenceTable:
+        make_request = _SOURCES[name]
+        items = []
+        from_id = None
+        while True:
+            page = await self.client(make_request(self.page_size, from_id))
+            items.extend(page)
+            if len(page) < self.page_size:
+                break
+            from_id = max(item.id for item in page)
+        return ReferenceTable(name, items)
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.ttl)
+            for name in self.references:
+                try:
+                    self._tables[name] = await self._load(name)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    warn(
+                        f"Failed to refresh reference {name}, previous data is kept: {e!r}"
+                    )
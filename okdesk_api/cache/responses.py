@@ -0,0 +1,274 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import typing
+
+# total size of cached bodies, bytes
+DEFAULT_MAX_SIZE = 2**28
+
+# seconds to wait for a lock held by another process
+BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    content_type TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires);
+"""
+
+
+class CachedResponse(typing.NamedTuple):
+    """Stored response (Сохраненный ответ)"""
+
+    url: str
+    status: int
+    content_type: typing.Optional[str]
+    body: bytes
+    created: float
+    expires: float
+
+
+class ResponseCache:
+    """
+    Cache of GET responses in a SQLite database, shared by all processes, which use the same file,
+    and kept between restarts. The database works in WAL mode, so readers don't block each other
+    and a writer. Raw bodies are stored with status, content type and expiration time. When the total
+    size of bodies exceeds `max_size`, expired and then least recently used responses are removed.
+    (Кэш ответов на GET запросы в базе SQLite, общий для процессов и сохраняющийся между перезапусками.
+    При превышении max_size удаляются устаревшие и давно не использованные ответы.)
+
+    >>> client = OkDeskClient(base_url, token, response_cache=ResponseCache("/var/cache/okdesk.sqlite", ttl=600))
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 300,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        """
+        :param path: Database file, created if missing (Файл базы данных)
+        :param ttl: Seconds a response is valid (Время жизни ответа в секундах)
+        :param max_size: Max total size of bodies in bytes (Максимальный размер ответов в байтах)
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        if max_size < 0:
+            raise ValueError("max_size must be >= 0")
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        # one connection per executor thread
+        self._local = threading.local()
+        self._connections: typing.List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params: typing.Any = None) -> str:
+        """
+        Returns cache key of a GET request. Params include api_token, so accounts and users don't share
+        responses, the token itself is not stored. (Возвращает ключ кэша для GET запроса.)
+        """
+        items = params.items() if isinstance(params, dict) else params or ()
+        data = json.dumps(
+            [url, sorted((str(k), str(v)) for k, v in items)], ensure_ascii=False
+        )
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    async def get(self, key: str) -> typing.Optional[CachedResponse]:
+        """Returns valid response or None (Возвращает действительный ответ или None)"""
+        return await _run(self._get, key)
+
+    async def set(
+        self,
+        key: str,
+        url: str,
+        status: int,
+        content_type: typing.Optional[str],
+        body: bytes,
+        ttl: typing.Optional[float] = None,
+    ):
+        """
+        Stores a response, removing old ones if the cache exceeds max_size. Bodies larger than
+        max_size are not stored. (Сохраняет ответ.)
+
+        :param url: URL without the base, used by `invalidate` (URL без базового адреса)
+        :param ttl: Seconds the response is valid, self.ttl by default (Время жизни в секундах)
+        """
+        if len(body) > self.max_size:
+            return
+        await _run(self._set, key, url, status, content_type, body, ttl or self.ttl)
+
+    async def invalidate(
+        self, url_prefix: str, collection: typing.Optional[str] = None
+    ) -> int:
+        """
+        Removes responses of url_prefix and URLs under it, e.g. "api/v1/issues/15" removes
+        "api/v1/issues/15/comments", but not "api/v1/issues/150". With collection, e.g. "api/v1/issues",
+        also removes its responses, which are not objects by id: "api/v1/issues/list", "api/v1/issues/count".
+        (Удаляет ответы для url_prefix и вложенных URL, а также списков collection.)
+
+        :param url_prefix: Changed object (Измененный объект)
+        :param collection: Collection of the object, its lists and counts are removed (Коллекция объекта)
+        :return: Number of removed responses (Количество удаленных ответов)
+        """
+        return await _run(self._invalidate, url_prefix, collection)
+
+    async def evict(self):
+        """
+        Removes expired responses and least recently used ones until the cache fits into max_size.
+        (Удаляет устаревшие и давно не использованные ответы.)
+        """
+        await _run(self._write, self._evict)
+
+    async def clear(self):
+        """Removes all responses (Удаляет все ответы)"""
+        await _run(self._write, lambda db: db.execute("DELETE FROM responses"))
+
+    async def size(self) -> int:
+        """Total size of stored bodies in bytes (Размер ответов в байтах)"""
+        return await _run(self._size)
+
+    def close(self):
+        """Closes database connections (Закрывает соединения с базой)"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+        # transactions are managed explicitly with BEGIN IMMEDIATE
+        connection = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+        except BaseException:
+            connection.close()
+            raise
+        with self._lock:
+            self._connections.append(connection)
+            self._local.connection = connection
+        return connection
+
+    def _write(self, function, *args):
+        # the write lock is taken at the start, so concurrent writers wait for busy timeout
+        # instead of failing on lock upgrade
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            result = function(db, *args)
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+        return result
+
+    def _get(self, key: str) -> typing.Optional[CachedResponse]:
+        now = time.time()
+        db = self._connect()
+        row = db.execute(
+            "SELECT url, status, content_type, body, created, expires, accessed "
+            "FROM responses WHERE key = ? AND expires > ?",
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return None
+        # access time has second precision to avoid a write on every hit
+        if now - row[6] >= 1:
+            self._write(
+                lambda db: db.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+                )
+            )
+        return CachedResponse(*row[:6])
+
+    def _set(
+        self,
+        key: str,
+        url: str,
+        status: int,
+        content_type: typing.Optional[str],
+        body: bytes,
+        ttl: float,
+    ):
+        now = time.time()
+
+        def insert(db: sqlite3.Connection):
+            db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status, content_type, body, size, created, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, content_type, body, len(body), now, now + ttl, now),
+            )
+            self._evict(db)
+
+        self._write(insert)
+
+    def _evict(self, db: sqlite3.Connection):
+        db.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+        removed = []
+        for key, size in db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ):
+            if total <= self.max_size:
+                break
+            removed.append((key,))
+            total -= size
+        db.executemany("DELETE FROM responses WHERE key = ?", removed)
+
+    def _invalidate(self, url_prefix: str, collection: typing.Optional[str]) -> int:
+        # LIKE treats % and _ as wildcards, so prefixes are compared with substr
+        url_prefix = url_prefix.rstrip("/")
+
+        def delete(db: sqlite3.Connection) -> int:
+            removed = db.execute(
+                "DELETE FROM responses WHERE url = ? OR substr(url, 1, ?) = ?",
+                (url_prefix, len(url_prefix) + 1, url_prefix + "/"),
+            ).rowcount
+            if collection is not None:
+                base = collection.rstrip("/")
+                # the collection itself and children, which don't start with a digit (not ids)
+                removed += db.execute(
+                    "DELETE FROM responses WHERE url = ? OR (substr(url, 1, ?) = ? "
+                    "AND substr(url, ?, 1) NOT BETWEEN '0' AND '9')",
+                    (base, len(base) + 1, base + "/", len(base) + 2),
+                ).rowcount
+            return removed
+
+        return self._write(delete)
+
+    def _size(self) -> int:
+        return (
+            self._connect()
+            .execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()[0]
+        )
+
+
+async def _run(function, *args):
+    return await asyncio.get_running_loop().run_in_executor(None, function, *args)
@@ -1,12 +1,19 @@
+import collections
+import concurrent.futures
+import copy
+import functools
 import json
+import os
+import time
 import typing
+import urllib.parse
 
 import aiohttp
 import asyncio
 import aiohttp.client_exceptions
 
 from .. import types
-from ..errors import OkDeskError
+from ..errors import OkDeskError, PartialUploadError
 from ..api import (
     companies,
     issues,
@@ -18,6 +25,8 @@ from ..api import (
     nomenclature,
 )
 from .. import helpers
+from . import downloads
+from ..cache import ResponseCache
 import datetime
 from warnings import warn
 
@@ -30,6 +39,11 @@ class OkDeskClient:
         debug: bool = False,
         auto_retry_count: int = 5,
         auto_retry_delay: float = 1.0,
+        parse_executor: typing.Union[
+            None, typing.Literal["thread", "process"], concurrent.futures.Executor
+        ] = None,
+        parse_threshold: int = 256 * 1024,
+        response_cache: typing.Optional[ResponseCache] = None,
     ):
         """
         Create a OkDesk instance.
@@ -40,6 +54,13 @@ class OkDeskClient:
         :param debug:  If True, prints all requests and responses (Если True, печатает все запросы и ответы)
         :param auto_retry_count:  Number of times to retry a request if it fails (ClientConnectError, errorcode > 500, etc) (Количество попыток повторить запрос, если он не удался (ClientConnectError, errorcode> 500 и т. Д.))
         :param auto_retry_delay:  Delay between retries (Задержка между повторами)
+        :param parse_executor:  Where to decode and parse large responses, so they don't block the event loop:
+         None (on the loop), "thread", "process" or an Executor instance, which is not shut down by `close`
+         (Где разбирать большие ответы: None - в цикле событий, "thread", "process" или экземпляр Executor)
+        :param parse_threshold:  Minimal response size in bytes to be parsed in parse_executor
+         (Минимальный размер ответа в байтах для разбора в parse_executor)
+        :param response_cache:  Cache of successful GET responses, e.g. cache.ResponseCache shared by worker processes
+         (Кэш успешных ответов на GET запросы)
         """
         import re
 
@@ -56,12 +77,30 @@ class OkDeskClient:
         if auto_retry_delay < 0:
             raise ValueError("auto_retry_delay must be >= 0")
         self._auto_retry_delay = auto_retry_delay
+        if parse_executor not in (None, "thread", "process") and not isinstance(
+            parse_executor, concurrent.futures.Executor
+        ):
+            raise ValueError(
+                'parse_executor must be None, "thread", "process" or an Executor'
+            )
+        self._parse_executor = parse_executor
+        self._parse_threshold = parse_threshold
+        # executor created by the client itself, shut down in close()
+        self._own_parse_executor: typing.Optional[concurrent.futures.Executor] = None
+        # upload/download throughput of multipart requests and attachment downloads
+        # (статистика передачи файлов)
+        self.transfer_stats = helpers.TransferStats()
+        self._trace_config = aiohttp.TraceConfig()
+        self._trace_config.on_request_chunk_sent.append(_on_request_chunk_sent)
+        self._response_cache = response_cache
 
     async def request(
         self,
         method: typing.Literal["GET", "POST", "PUT", "DELETE", "PATCH"],
         url: str,
         allow_non_json=False,
+        cache=True,
+        _raw_body=False,
         **kwargs,
     ) -> dict:
         """
@@ -73,6 +112,7 @@ class OkDeskClient:
         :param method: HTTP method GET, POST, PUT, DELETE
         :param url:  URL to request WITHOUT https://<account>.okdesk.ru/ (URL для запроса БЕЗ https://<account>.okdesk.ru/)
         :param allow_non_json:  If True, error is not raised if the response is not JSON (Если True, ошибка не вызывается, если ответ не JSON)
+        :param cache:  If False, response_cache of the client is not used (Если False, кэш ответов не используется)
         :param kwargs:  Additional arguments for aiohttp.ClientSession.request
          (Дополнительные аргументы для aiohttp.ClientSession.request)
 
@@ -82,12 +122,19 @@ class OkDeskClient:
             raise ValueError("url must not start with https://!")
         if url.startswith("/"):
             url = url[1:]
+        path = url
         url = self._base_url + url
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=[self._trace_config]) as session:
             kwargs.setdefault("params", {})
             kwargs.setdefault("headers", {})
 
             kwargs["params"]["api_token"] = self._api_token
+            cache_key = None
+            if self._response_cache is not None and cache and method == "GET":
+                cache_key = self._response_cache.key(url, kwargs["params"])
+                cached = await self._response_cache.get(cache_key)
+                if cached is not None:
+                    return cached.body if _raw_body else json.loads(cached.body)
             is_json = kwargs.get("json") is not None
             if is_json:
                 kwargs["data"] = json.dumps(
@@ -97,6 +144,11 @@ class OkDeskClient:
                     indent=4 if self._debug else None,
                 )
                 kwargs["headers"]["Content-Type"] = "application/json"
+            # multipart body is opened for every attempt, files are streamed from disk
+            # (multipart тело создается для каждой попытки, файлы читаются с диска частями)
+            form = None
+            if isinstance(kwargs.get("data"), helpers.MultipartForm):
+                form = kwargs.pop("data")
 
             # allow gzipped responses
             # (разрешаем сжатые ответы)
@@ -104,6 +156,15 @@ class OkDeskClient:
             last_exception = None
             for retry_num in range(1, self._auto_retry_count + 1):
                 is_last_retry = retry_num == self._auto_retry_count
+                handles = tracker = None
+                if form is not None:
+                    form_data, handles = await form.open()
+                    # payload knows the total size of the body
+                    kwargs["data"] = form_data()
+                    tracker = helpers.ProgressTracker(
+                        form.progress, kwargs["data"].size, self.transfer_stats
+                    )
+                    kwargs["trace_request_ctx"] = tracker
                 try:
                     async with session.request(method, url, **kwargs) as resp:
 
@@ -130,11 +191,21 @@ class OkDeskClient:
                             last_exception = OkDeskError(
                                 json_resp.get("errors", [f"Unknown error - server returned {resp.status}"])
                             )
-                            if is_last_retry:
+                            if is_last_retry or not _can_resend(form):
                                 raise last_exception
                             await asyncio.sleep(self._auto_retry_delay)
                             continue
 
+                        if (
+                            self._response_cache is not None
+                            and method != "GET"
+                            and resp.status < 400
+                        ):
+                            # cached responses of the changed object are stale now
+                            await self._response_cache.invalidate(
+                                *_invalidation_prefixes(path)
+                            )
+
                         if resp.content_type != "application/json":
                             if allow_non_json:
                                 return {}
@@ -142,7 +213,17 @@ class OkDeskClient:
                                 f"Response is not JSON: `{resp.content_type}` : {await resp.text()}"
                             )
 
-
+                        if cache_key is not None and resp.status < 400:
+                            await self._response_cache.set(
+                                cache_key,
+                                path,
+                                resp.status,
+                                resp.content_type,
+                                await resp.read(),
+                            )
+                        if _raw_body and resp.status < 400:
+                            # decoded by the caller, possibly in parse executor
+                            return await resp.read()
                         json_resp = await resp.json()
                         if resp.status >= 400:
                             raise OkDeskError(json_resp.get("errors", ["Unknown error"]))
@@ -151,21 +232,60 @@ class OkDeskClient:
                     aiohttp.client_exceptions.ClientConnectorError,
                     asyncio.TimeoutError,
                 ) as e:
-                    if is_last_retry:
+                    if is_last_retry or not _can_resend(form):
                         raise e
                     await asyncio.sleep(self._auto_retry_delay)
                     last_exception = e
+                finally:
+                    if tracker is not None:
+                        tracker.finish()
+                    if handles:
+                        # closed on success, error and cancellation
+                        # (закрываем файлы в любом случае)
+                        await form.close(handles)
         if last_exception is not None:
             raise last_exception
         raise OkDeskError(["Unknown error - no exception was raised"])
 
     # function that allows us to use client as a caller
     # (функция, которая позволяет нам использовать client как вызывающий)
-    async def __call__(self, request):
+    async def __call__(self, request, cache: bool = True):
         if not isinstance(request, types.ApiRequest):
             raise TypeError("request must be an ApiRequest")
-        result = await self.request(**request.to_request())
-        return request.from_response(result)
+        if self._parse_executor is None:
+            result = await self.request(**request.to_request(), cache=cache)
+            return request.from_response(result)
+        body = await self.request(**request.to_request(), cache=cache, _raw_body=True)
+        if not isinstance(body, bytes):
+            return request.from_response(body)
+        if len(body) < self._parse_threshold:
+            return request.from_response(json.loads(body))
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_parse_executor(), _parse_response, request.parse_state(), body
+        )
+
+    def _get_parse_executor(self) -> concurrent.futures.Executor:
+        if isinstance(self._parse_executor, concurrent.futures.Executor):
+            return self._parse_executor
+        if self._own_parse_executor is None:
+            if self._parse_executor == "process":
+                self._own_parse_executor = concurrent.futures.ProcessPoolExecutor()
+            else:
+                self._own_parse_executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="okdesk-parse"
+                )
+        return self._own_parse_executor
+
+    async def close(self):
+        """
+        Shuts down parse executor, created by the client.
+        (Останавливает пул для разбора ответов, созданный клиентом.)
+        """
+        executor, self._own_parse_executor = self._own_parse_executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, executor.shutdown, True
+            )
 
     # companies
     async def find_companies(
@@ -321,6 +441,8 @@ class OkDeskClient:
         page_size: int = None,
         page_from_id: int = None,
         page_direction: typing.Literal["reverse", "forward"] = None,
+        lazy: bool = False,
+        fields: typing.Optional[typing.List[str]] = None,
     ) -> typing.List[companies.Company]:
         """
 
@@ -338,6 +460,8 @@ class OkDeskClient:
         :param page_size: Number of returned records. Cannot exceed 100. (Число возвращаемых записей. Не может превышать 100.)
         :param page_from_id: ID of companies from which the selection of records begins. By default (if the direction parameter is not set) the selection is made in the direction from the value of from_id towards the decrease of the company id. (ID компаний, с которой начинается выборка записей. По умолчанию (если не задан параметр direction) выборка осуществляется в направлении от значения from_id в сторону уменьшения id компании.)
         :param page_direction: Direction of selection. Two values are available: reverse, forward. reverse - returns records whose ID is less than the value of from_id, if the from_id parameter is passed. If the from_id parameter is not passed, the selection is made from the largest company id value. forward - returns records whose ID is greater than the value of from_id, if the from_id parameter is passed. If the from_id parameter is not passed, the selection is made from the smallest company id value. (Направление выборки. Доступно два значения: reverse, forward. reverse - возвращает записи, ID которых меньше значения from_id, если параметр from_id передан. При отсутствии параметра from_id выборка осуществляется от наибольшего значения id компании. forward - возвращает записи, ID которых больше значения from_id, если параметр from_id передан. При отсутствии параметра from_id выборка осуществляется от наименьшего значения id компании.)
+        :param lazy: If True, returns lazy models, which parse fields on first access (Если True, поля разбираются при первом обращении)
+        :param fields: If set, returns lightweight records with only these fields, e.g. ["id", "name", "category.code"] (Если задано, возвращаются записи только с этими полями)
         :return: List of companies
         """
         return await self(
@@ -356,6 +480,8 @@ class OkDeskClient:
                 page_size=page_size,
                 page_from_id=page_from_id,
                 page_direction=page_direction,
+                lazy=lazy,
+                fields=fields,
             )
         )
 
@@ -532,6 +658,7 @@ class OkDeskClient:
         page_size: typing.Optional[int] = None,
         page_from_id: typing.Optional[int] = None,
         page_direction: typing.Optional[typing.Literal["reverse", "forward"]] = None,
+        lazy: bool = False,
     ) -> typing.List[maintenance_entities.MaintanceEntity]:
         """
 
@@ -545,6 +672,7 @@ class OkDeskClient:
         :param page_size: Page size (Число возвращаемых записей)
         :param page_from_id: Page from id (D объекта обслуживания, с которого начинается выборка записей)
         :param page_direction: Page direction (Направление выборки)
+        :param lazy: If True, returns lazy models, which parse fields on first access (Если True, поля разбираются при первом обращении)
         :return: Maintenance entities (Объекты обслуживания)
         """
 
@@ -560,25 +688,207 @@ class OkDeskClient:
                 page_size=page_size,
                 page_from_id=page_from_id,
                 page_direction=page_direction,
+                lazy=lazy,
             )
         )
 
     async def add_maintenance_entity_attachment(
-        self, maintenance_entity_id: int, attachments: typing.List[types.Attachment]
+        self,
+        maintenance_entity_id: int,
+        attachments: typing.List[types.Attachment],
+        skip_duplicates: bool = False,
+        existing_attachments: typing.Optional[typing.List[shared.Attachment]] = None,
+        hash_algorithm: typing.Optional[str] = None,
+        progress: typing.Optional[helpers.ProgressCallback] = None,
+        split: bool = False,
+        bucket_size: typing.Optional[int] = None,
+        max_concurrency: int = 4,
     ) -> maintenance_entities.MaintanceEntity:
         """
 
         :param maintenance_entity_id: Maintenance entity ID (ID объекта обслуживания)
         :param attachments:  (Список приложенных локальных файлов)
+        :param skip_duplicates: Don't upload files with the same name and size as already attached ones,
+         see helpers.skip_duplicate_attachments (Не загружать файлы, которые уже прикреплены)
+        :param existing_attachments: Already attached files (MaintanceEntity.attachments),
+         requested from the API if not set (Уже прикрепленные файлы)
+        :param hash_algorithm: Also compare files of the list by content hash, e.g. "sha256"
+         (Сравнивать файлы списка по хэшу содержимого)
+        :param progress: Called with helpers.TransferProgress while files are uploaded (Функция отслеживания прогресса отправки)
+        :param split: Upload files with several concurrent requests instead of one. Files of a failed request
+         are retried one by one, if all of them can be read again (paths, bytes, seekable file objects)
+         and were not stored by the server, results are merged (Загружать файлы несколькими параллельными запросами)
+        :param bucket_size: With split, max total size of files in one request in bytes, one file per request
+         if not set (Максимальный размер файлов в одном запросе, по одному файлу, если не задан)
+        :param max_concurrency: With split, max number of simultaneous requests (Максимум одновременных запросов)
+        :raises PartialUploadError: with split, if some files were not uploaded, other files stay uploaded
+         (если часть файлов не удалось загрузить)
         :return: Maintenance entity (Объект обслуживания)
         """
+        if skip_duplicates:
+            entity = None
+            if existing_attachments is None:
+                # read after a possible write, so the response cache is bypassed
+                entity = await self(
+                    maintenance_entities.GetMaintenanceEntityRequest(
+                        id_=maintenance_entity_id
+                    ),
+                    cache=False,
+                )
+                existing_attachments = entity.attachments
+            attachments = await helpers.skip_duplicate_attachments(
+                attachments, existing_attachments, hash_algorithm
+            )
+            if not attachments:
+                if entity is not None:
+                    return entity
+                # existing_attachments came from the caller, the entity is not fetched yet
+                return await self(
+                    maintenance_entities.GetMaintenanceEntityRequest(
+                        id_=maintenance_entity_id
+                    ),
+                    cache=False,
+                )
+        if split and len(attachments) > 1:
+            return await self._add_maintenance_entity_attachment_split(
+                maintenance_entity_id,
+                attachments,
+                existing_attachments,
+                progress,
+                bucket_size,
+                max_concurrency,
+            )
         return await self(
             maintenance_entities.AddMaintenanceEntityAttachmentRequest(
                 maintenance_entity_id=maintenance_entity_id,
                 attachments=attachments,
+                progress=progress,
             )
         )
 
+    async def _add_maintenance_entity_attachment_split(
+        self,
+        maintenance_entity_id: int,
+        attachments: typing.List[types.Attachment],
+        existing_attachments: typing.Optional[typing.List[shared.Attachment]],
+        progress: typing.Optional[helpers.ProgressCallback],
+        bucket_size: typing.Optional[int],
+        max_concurrency: int,
+    ) -> maintenance_entities.MaintanceEntity:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        groups = await helpers.group_attachments(attachments, bucket_size)
+
+        async def get_entity() -> maintenance_entities.MaintanceEntity:
+            return await self(
+                maintenance_entities.GetMaintenanceEntityRequest(
+                    id_=maintenance_entity_id
+                ),
+                cache=False,
+            )
+
+        def file_keys(entity_attachments) -> collections.Counter:
+            return collections.Counter(
+                (attachment.attachment_file_name, attachment.attachment_file_size)
+                for attachment in entity_attachments or ()
+            )
+
+        # a failed request with several files may have stored some of them, they are found
+        # by name and size among the attachments, which were not there before the upload
+        track_stored = any(len(group) > 1 for group in groups)
+        if track_stored and existing_attachments is None:
+            existing_attachments = (await get_entity()).attachments
+        known = file_keys(existing_attachments)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results: typing.List[maintenance_entities.MaintanceEntity] = []
+        failed = []
+        # progress of every request, summed up for the callback
+        sent, totals = {}, {}
+        started = time.monotonic()
+
+        def request_progress(key) -> typing.Optional[helpers.ProgressCallback]:
+            if progress is None:
+                return None
+
+            def callback(state: helpers.TransferProgress):
+                sent[key] = state.transferred
+                totals[key] = state.total
+                transferred = sum(sent.values())
+                total = None
+                if len(totals) >= len(groups) and None not in totals.values():
+                    total = sum(totals.values())
+                elapsed = time.monotonic() - started
+                rate = transferred / elapsed if elapsed else 0.0
+                progress(helpers.TransferProgress(transferred, total, rate))
+
+            return callback
+
+        async def upload(key, group: typing.List[types.Attachment]):
+            snapshot = None
+            if track_stored:
+                snapshot = await helpers.snapshot_attachments(group)
+            try:
+                async with semaphore:
+                    results.append(
+                        await self(
+                            maintenance_entities.AddMaintenanceEntityAttachmentRequest(
+                                maintenance_entity_id=maintenance_entity_id,
+                                attachments=group,
+                                progress=request_progress(key),
+                            )
+                        )
+                    )
+                if snapshot is not None:
+                    known.update((state.filename, state.size) for state in snapshot)
+            except Exception as e:
+                if len(group) == 1:
+                    failed.append((group[0], e))
+                    return
+                if snapshot is None:
+                    # async iterators and non-seekable files were consumed by the failed request
+                    failed.extend((attachment, e) for attachment in group)
+                    return
+                try:
+                    entity = await get_entity()
+                except Exception:
+                    failed.extend((attachment, e) for attachment in group)
+                    return
+                results.append(entity)
+                stored = file_keys(entity.attachments) - known
+                # the other files of the group may be fine, so they are retried one by one
+                retry = []
+                for attachment, state in zip(group, snapshot):
+                    file_key = (state.filename, state.size)
+                    if stored[file_key] > 0:
+                        stored[file_key] -= 1
+                        known[file_key] += 1
+                    else:
+                        retry.append(attachment)
+                sent.pop(key, None)
+                totals.pop(key, None)
+                await helpers.rewind_attachments(group, snapshot)
+                await asyncio.gather(
+                    *(
+                        upload((key, i), [attachment])
+                        for i, attachment in enumerate(retry)
+                    )
+                )
+
+        await asyncio.gather(*(upload(i, group) for i, group in enumerate(groups)))
+
+        result = None
+        if results:
+            # every response has attachments known at that moment, so they are merged by id
+            merged = {}
+            for entity in results:
+                for attachment in entity.attachments or ():
+                    merged[attachment.id] = attachment
+            result = results[-1]
+            result.attachments = sorted(merged.values(), key=lambda item: item.id)
+        if failed:
+            raise PartialUploadError(failed, result)
+        return result
+
     # issues
     async def create_issue(
         self,
@@ -603,6 +913,9 @@ class OkDeskClient:
         parent_id: typing.Optional[str] = None,
         author: typing.Optional[dict] = None,
         files: typing.Optional[typing.List[types.Attachment]] = None,
+        skip_duplicates: bool = False,
+        hash_algorithm: typing.Optional[str] = None,
+        progress: typing.Optional[helpers.ProgressCallback] = None,
     ) -> issues.Issue:
         """
 
@@ -627,8 +940,17 @@ class OkDeskClient:
         :param parent_id: ID of the parent request (ID родительской заявки)
         :param author: author of the request (Автор заявки)
         :param files: files to attach (Прикрепляемые файлы)
+        :param skip_duplicates: Upload repeated files (same name and size) only once
+         (Загружать повторяющиеся файлы один раз)
+        :param hash_algorithm: Also compare files by content hash, e.g. "sha256"
+         (Сравнивать файлы по хэшу содержимого)
+        :param progress: Called with helpers.TransferProgress while files are uploaded (Функция отслеживания прогресса отправки)
         :return: Created issue (Созданная заявка)
         """
+        if skip_duplicates and files:
+            files = await helpers.skip_duplicate_attachments(
+                files, hash_algorithm=hash_algorithm
+            )
         return await self(
             issues.CreateIssueRequest(
                 title=title,
@@ -652,6 +974,7 @@ class OkDeskClient:
                 parent_id=parent_id,
                 author=author,
                 files=files,
+                progress=progress,
             )
         )
 
@@ -795,6 +1118,10 @@ class OkDeskClient:
         author_type: typing.Optional[typing.Literal["employee", "contact"]] = None,
         public: typing.Optional[bool] = None,
         attachments: typing.Optional[typing.List[types.Attachment]] = None,
+        skip_duplicates: bool = False,
+        existing_attachments: typing.Optional[typing.List[shared.Attachment]] = None,
+        hash_algorithm: typing.Optional[str] = None,
+        progress: typing.Optional[helpers.ProgressCallback] = None,
     ):
         """
 
@@ -804,8 +1131,26 @@ class OkDeskClient:
         :param author_type: User type (Тип пользователя)
         :param public: Public flag (Флаг публичности комментария)
         :param attachments: List of attached files (Список приложенных локальных файлов)
+        :param skip_duplicates: Don't upload files with the same name and size as already attached ones,
+         see helpers.skip_duplicate_attachments (Не загружать файлы, которые уже прикреплены)
+        :param existing_attachments: Already attached files (Issue.attachments),
+         requested from the API if not set (Уже прикрепленные файлы)
+        :param hash_algorithm: Also compare files of the list by content hash, e.g. "sha256"
+         (Сравнивать файлы списка по хэшу содержимого)
+        :param progress: Called with helpers.TransferProgress while files are uploaded (Функция отслеживания прогресса отправки)
         :return: Added comment (Добавленный комментарий)
         """
+        if skip_duplicates and attachments:
+            if existing_attachments is None:
+                issue = await self(issues.GetIssueRequest(issue_id), cache=False)
+                existing_attachments = issue.attachments
+            # the comment is added anyway, even if all its files are skipped
+            attachments = (
+                await helpers.skip_duplicate_attachments(
+                    attachments, existing_attachments, hash_algorithm
+                )
+                or None
+            )
         return await self(
             issues.AddCommentRequest(
                 issue_id=issue_id,
@@ -814,6 +1159,7 @@ class OkDeskClient:
                 author_type=author_type,
                 public=public,
                 attachments=attachments,
+                progress=progress,
             )
         )
 
@@ -859,7 +1205,8 @@ class OkDeskClient:
         planned_reaction_since: typing.Optional[datetime.datetime] = None,
         planned_reaction_until: typing.Optional[datetime.datetime] = None,
         custom_parameters: typing.Optional[typing.List[helpers.AttributeFilter]] = None,
-    ) -> typing.List[int]:
+        as_id_set: bool = False,
+    ) -> typing.Union[typing.List[int], types.IdSet]:
         """
 
         :param assignee_ids: IDs of employees who are responsible for the ticket (ID ответственных сотрудников)
@@ -894,7 +1241,8 @@ class OkDeskClient:
         :param planned_reaction_since: Datetime of planned reaction since (Дата-время планируемой реакции С)
         :param planned_reaction_until: Datetime of planned reaction until (Дата-время планируемой реакции По)
         :param custom_parameters: Custom parameters (Пользовательские параметры)
-        :return:
+        :param as_id_set: If True, returns a compact types.IdSet instead of a list (Если True, возвращается types.IdSet вместо списка)
+        :return: Issue ids (ID заявок)
         """
         return await self(
             issues.GetIssuesListIdRequest(
@@ -930,9 +1278,102 @@ class OkDeskClient:
                 planned_reaction_since=planned_reaction_since,
                 planned_reaction_until=planned_reaction_until,
                 custom_parameters=custom_parameters,
+                as_id_set=as_id_set,
             )
         )
 
+    async def get_issues_id_list_windowed(
+        self,
+        request: issues.GetIssuesListIdRequest,
+        since: datetime.date,
+        until: datetime.date,
+        field: typing.Literal["created", "updated"] = "created",
+        window: datetime.timedelta = datetime.timedelta(days=31),
+        max_ids_per_window: typing.Optional[int] = None,
+        window_timeout: typing.Optional[float] = None,
+        max_concurrency: int = 4,
+    ) -> typing.Union[typing.List[int], types.IdSet]:
+        """
+        Splits a broad GetIssuesListIdRequest into date windows by `field` and runs them concurrently.
+        A window is bisected again if it returned `max_ids_per_window` ids or more (the result looks capped),
+        or if it did not finish within `window_timeout` seconds. Ids of all windows are merged without duplicates.
+        (Разбивает запрос списка ID заявок на окна по дате и выполняет их параллельно.
+        Окно делится пополам, если результат похож на обрезанный или запрос выполнялся слишком долго.)
+
+        :param request: Request with all the other filters, its `<field>_since`/`<field>_until` are overwritten (Запрос с остальными фильтрами)
+        :param since: First day of the whole range (Первый день диапазона)
+        :param until: Last day of the whole range, inclusive (Последний день диапазона, включительно)
+        :param field: Which date filter to split: created_* or updated_* (По какому фильтру дат разбивать)
+        :param window: Initial window size, rounded to whole days (Начальный размер окна)
+        :param max_ids_per_window: If a window returns at least this many ids, it is bisected (Порог количества ID для деления окна)
+        :param window_timeout: If a window takes longer than this (seconds), it is bisected (Таймаут окна в секундах)
+        :param max_concurrency: Max number of windows requested at the same time (Максимум одновременных запросов)
+        :return: Sorted unique issue ids, types.IdSet if request.as_id_set is set (Отсортированные уникальные ID заявок)
+        """
+        if field not in ("created", "updated"):
+            raise ValueError("field must be either 'created' or 'updated'")
+        if isinstance(since, datetime.datetime):
+            since = since.date()
+        if isinstance(until, datetime.datetime):
+            until = until.date()
+        if since > until:
+            raise ValueError("since must be <= until")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        one_day = datetime.timedelta(days=1)
+        window_days = max(window.days, 1)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(window_since: datetime.date, window_until: datetime.date):
+            window_request = copy.copy(request)
+            setattr(window_request, f"{field}_since", window_since)
+            setattr(window_request, f"{field}_until", window_until)
+            async with semaphore:
+                # a single day can't be split any further, so there is no point in timing it out
+                if window_timeout is None or window_since == window_until:
+                    return await self(window_request)
+                try:
+                    return await asyncio.wait_for(self(window_request), window_timeout)
+                except asyncio.TimeoutError:
+                    return None
+
+        async def collect(
+            window_since: datetime.date, window_until: datetime.date
+        ) -> list:
+            ids = await fetch(window_since, window_until)
+            looks_capped = (
+                ids is not None
+                and max_ids_per_window is not None
+                and len(ids) >= max_ids_per_window
+            )
+            if ids is not None and not looks_capped:
+                return [ids]
+            if window_since == window_until:
+                warn(
+                    f"Issue ids for {window_since} look capped ({len(ids)} ids), "
+                    f"but a single day can't be split any further"
+                )
+                return [ids]
+            middle = window_since + (window_until - window_since) // 2
+            left, right = await asyncio.gather(
+                collect(window_since, middle), collect(middle + one_day, window_until)
+            )
+            return left + right
+
+        windows = []
+        window_since = since
+        while window_since <= until:
+            window_until = min(
+                window_since + datetime.timedelta(days=window_days - 1), until
+            )
+            windows.append(collect(window_since, window_until))
+            window_since = window_until + one_day
+
+        chunks = await asyncio.gather(*windows)
+        if request.as_id_set:
+            return types.IdSet().union(*(ids for chunk in chunks for ids in chunk))
+        return sorted(set().union(*(ids for chunk in chunks for ids in chunk)))
+
     async def get_issues_list_rich(
         self,
         company_ids: typing.Optional[typing.List[int]] = None,
@@ -951,6 +1392,8 @@ class OkDeskClient:
             typing.Literal["created_at", "updated_at"]
         ] = None,
         sorting_direction: typing.Optional[typing.Literal["reverse", "forward"]] = None,
+        lazy: bool = False,
+        fields: typing.Optional[typing.List[str]] = None,
     ) -> typing.List[issues.Issue]:
         """
 
@@ -968,6 +1411,8 @@ class OkDeskClient:
         :param page_size: Number of elements per page (Количество элементов на странице)
         :param sorting_field: Sorting field (Поле сортировки)
         :param sorting_direction: Sorting direction (Направление сортировки)
+        :param lazy: If True, returns lazy models, which parse fields on first access (Если True, поля разбираются при первом обращении)
+        :param fields: If set, returns lightweight records with only these fields, e.g. ["id", "updated_at", "status.code"] (Если задано, возвращаются записи только с этими полями)
         :return: Found issues (Найденные заявки)
         """
         return await self(
@@ -986,6 +1431,8 @@ class OkDeskClient:
                 page_size=page_size,
                 sorting_field=sorting_field,
                 sorting_direction=sorting_direction,
+                lazy=lazy,
+                fields=fields,
             )
         )
 
@@ -1158,6 +1605,7 @@ class OkDeskClient:
         checked: bool,
         item_parameters: dict = None,
         attachment: str = None,
+        progress: typing.Optional[helpers.ProgressCallback] = None,
     ) -> typing.List[issues.CheckListItem]:
         """
 
@@ -1166,6 +1614,7 @@ class OkDeskClient:
         :param checked: Checked (Признак выполненности)
         :param item_parameters: Item parameters (Параметры строки чек-листа)
         :param attachment: Attachment (Прикрепляемый файл)
+        :param progress: Called with helpers.TransferProgress while files are uploaded (Функция отслеживания прогресса отправки)
         :return: Check list (Чек-лист)
         """
         return await self(
@@ -1175,18 +1624,21 @@ class OkDeskClient:
                 checked=checked,
                 item_parameters=item_parameters,
                 attachment=attachment,
+                progress=progress,
             )
         )
 
-    async def get_issue(self, issue_id: int) -> issues.Issue:
+    async def get_issue(self, issue_id: int, lazy: bool = False) -> issues.Issue:
         """
 
         :param issue_id: ID of issue (ID заявки)
+        :param lazy: If True, returns a lazy model, which parses fields on first access (Если True, поля разбираются при первом обращении)
         :return: Issue (Заявка)
         """
         return await self(
             issues.GetIssueRequest(
                 issue_id=issue_id,
+                lazy=lazy,
             )
         )
 
@@ -1338,6 +1790,7 @@ class OkDeskClient:
         page_size: typing.Optional[int] = None,
         page_from_id: typing.Optional[int] = None,
         page_direction: typing.Optional[typing.Literal["reverse", "forward"]] = None,
+        fields: typing.Optional[typing.List[str]] = None,
     ) -> typing.List[equipments.Equipment]:
         """
 
@@ -1353,6 +1806,7 @@ class OkDeskClient:
         :param page_size: Number of returned records (Число возвращаемых записей)
         :param page_from_id: ID of equipment from which the selection starts (ID оборудования, с которого начинается выборка записей)
         :param page_direction: Selection direction (Направление выборки)
+        :param fields: If set, returns lightweight records with only these fields, e.g. ["id", "serial_number", "equipment_kind.code"] (Если задано, возвращаются записи только с этими полями)
         :return: Array of equipment (Массив оборудования)
         """
         return await self(
@@ -1369,6 +1823,7 @@ class OkDeskClient:
                 page_size=page_size,
                 page_from_id=page_from_id,
                 page_direction=page_direction,
+                fields=fields,
             )
         )
 
@@ -2031,3 +2486,154 @@ class OkDeskClient:
                 visible=visible,
             )
         )
+
+    # attachments
+    def _attachment_url(self, attachment: shared.Attachment) -> str:
+        if not attachment.attachment_url:
+            raise ValueError(
+                f"Attachment {attachment.id} has no attachment_url, "
+                f"get it with get_file_of_issue / get_company_file"
+            )
+        return urllib.parse.urljoin(self._base_url, attachment.attachment_url)
+
+    async def download_attachment(
+        self,
+        attachment: shared.Attachment,
+        path: str,
+        chunk_size: int = downloads.CHUNK_SIZE,
+        progress: typing.Optional[helpers.ProgressCallback] = None,
+    ) -> str:
+        """
+        Downloads attachment content to path by chunks. An interrupted download is resumed with
+        HTTP Range from "<path>.part", the result is verified against attachment_file_size.
+        If path already exists with the expected size, nothing is downloaded.
+        (Загружает содержимое вложения в файл по частям, с возобновлением прерванной загрузки
+        и проверкой размера. Уже загруженные файлы пропускаются.)
+
+        :param attachment: Attachment with attachment_url, e.g. from get_file_of_issue (Вложение)
+        :param path: Destination path (Путь для сохранения)
+        :param chunk_size: Size of chunks in bytes (Размер части в байтах)
+        :param progress: Called with helpers.TransferProgress while the file is downloaded
+         (Функция отслеживания прогресса загрузки)
+        :raises OkDeskError: if the download failed or the size does not match (если загрузка не удалась)
+        :return: path
+        """
+        url = self._attachment_url(attachment)
+        async with aiohttp.ClientSession() as session:
+            return await downloads.download_file(
+                session,
+                url,
+                path,
+                size=attachment.attachment_file_size,
+                chunk_size=chunk_size,
+                retry_count=self._auto_retry_count,
+                retry_delay=self._auto_retry_delay,
+                progress=progress,
+                stats=self.transfer_stats,
+            )
+
+    async def download_attachments(
+        self,
+        attachments: typing.Iterable[shared.Attachment],
+        directory: str,
+        max_concurrency: int = 8,
+        chunk_size: int = downloads.CHUNK_SIZE,
+        return_exceptions: bool = False,
+        progress: typing.Optional[
+            typing.Callable[[shared.Attachment, helpers.TransferProgress], typing.Any]
+        ] = None,
+    ) -> typing.List[typing.Union[str, Exception]]:
+        """
+        Downloads attachments into directory as "<id>_<attachment_file_name>", at most
+        `max_concurrency` at the same time over shared connections, see download_attachment.
+        (Загружает вложения в каталог, не более max_concurrency одновременно.)
+
+        :param attachments: Attachments with attachment_url (Вложения)
+        :param directory: Destination directory, created if missing (Каталог для сохранения)
+        :param max_concurrency: Max number of simultaneous downloads (Максимум одновременных загрузок)
+        :param chunk_size: Size of chunks in bytes (Размер части в байтах)
+        :param return_exceptions: If True, errors are returned in place of paths instead of being raised
+         (Если True, ошибки возвращаются вместо путей, а не вызываются)
+        :param progress: Called with the attachment and helpers.TransferProgress while it is downloaded
+         (Функция отслеживания прогресса, получает вложение и прогресс его загрузки)
+        :return: Paths of the files in the order of attachments (Пути к файлам в порядке вложений)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        attachments = list(attachments)
+        paths = [
+            os.path.join(directory, downloads.attachment_file_name(attachment))
+            for attachment in attachments
+        ]
+        # the same attachment is downloaded once, even if it is listed several times
+        pending = iter(dict(zip(paths, attachments)).items())
+        results = {}
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(os.makedirs, directory, exist_ok=True)
+        )
+
+        async def worker(session: aiohttp.ClientSession):
+            for path, attachment in pending:
+                try:
+                    results[path] = await downloads.download_file(
+                        session,
+                        self._attachment_url(attachment),
+                        path,
+                        size=attachment.attachment_file_size,
+                        chunk_size=chunk_size,
+                        retry_count=self._auto_retry_count,
+                        retry_delay=self._auto_retry_delay,
+                        progress=(
+                            functools.partial(progress, attachment)
+                            if progress
+                            else None
+                        ),
+                        stats=self.transfer_stats,
+                    )
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[path] = e
+
+        async with aiohttp.ClientSession() as session:
+            workers = [
+                asyncio.create_task(worker(session))
+                for _ in range(min(max_concurrency, len(attachments)))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                # the first error stops the other downloads
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        return [results[path] for path in paths]
+
+
+async def _on_request_chunk_sent(session, context, params):
+    # counts sent bytes of multipart bodies, which pass ProgressTracker as trace_request_ctx
+    tracker = context.trace_request_ctx
+    if isinstance(tracker, helpers.ProgressTracker):
+        tracker.add(len(params.chunk))
+
+
+def _can_resend(form: typing.Optional[helpers.MultipartForm]) -> bool:
+    # async iterators and non-seekable files can't be sent by another attempt
+    return form is None or form.can_resend()
+
+
+def _invalidation_prefixes(path: str) -> typing.Tuple[str, typing.Optional[str]]:
+    # "api/v1/issues/15/comments" -> ("api/v1/issues/15", "api/v1/issues"): the object with its
+    # nested resources, and the collection, whose lists and counts include the object
+    parts = path.split("?", 1)[0].strip("/").split("/")
+    for i, part in enumerate(parts):
+        if part.isdigit():
+            return "/".join(parts[: i + 1]), "/".join(parts[:i])
+    return "/".join(parts), None
+
+
+def _parse_response(state: typing.Tuple[type, dict], body: bytes):
+    # module level, so it can be pickled for ProcessPoolExecutor. The request is not sent,
+    # it may hold files or progress callbacks, which can't be pickled
+    request = types.ApiRequest.from_parse_state(state)
+    return request.from_response(json.loads(body))
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import re
+import typing
+
+import aiohttp
+
+from .. import helpers
+from ..errors import OkDeskError
+
+# size of chunks, read from the response and written to the file
+CHUNK_SIZE = 2**18
+
+PART_SUFFIX = ".part"
+
+_UNSAFE_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+
+def attachment_file_name(attachment) -> str:
+    """
+    Returns file name for the attachment in a download directory: "<id>_<attachment_file_name>".
+    (Возвращает имя файла вложения в каталоге загрузки.)
+    """
+    name = _UNSAFE_CHARS.sub("_", attachment.attachment_file_name or "")
+    return f"{attachment.id}_{name}" if name.strip(". ") else str(attachment.id)
+
+
+def _file_size(path: str) -> typing.Optional[int]:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def _run(function, *args):
+    return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+
+async def _download_part(
+    session: aiohttp.ClientSession,
+    url: str,
+    part_path: str,
+    size: typing.Optional[int],
+    chunk_size: int,
+    progress: typing.Optional[helpers.ProgressCallback],
+    stats: typing.Optional[helpers.TransferStats],
+):
+    offset = await _run(_file_size, part_path) or 0
+    if size is not None and offset > size:
+        await _run(_remove, part_path)
+        offset = 0
+    if offset and offset == size:
+        return
+    # ranges must refer to the stored bytes, so the content is not decoded
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    async with session.get(url, headers=headers) as resp:
+        if resp.status == 416 and offset:
+            # the part file does not match the remote file, start over on the next attempt
+            await _run(_remove, part_path)
+            resp.raise_for_status()
+        if resp.status >= 500:
+            resp.raise_for_status()
+        if resp.status >= 400:
+            raise OkDeskError(
+                [f"Download of {url} failed: {resp.status} {resp.reason}"]
+            )
+        # 200 instead of 206 means the server ignored the range and sends the whole file
+        resumed = resp.status == 206
+        tracker = helpers.ProgressTracker(
+            progress,
+            size,
+            stats,
+            upload=False,
+            transferred=offset if resumed else 0,
+        )
+        file = await _run(open, part_path, "ab" if resumed else "wb")
+        try:
+            async for chunk in resp.content.iter_chunked(chunk_size):
+                await _run(file.write, chunk)
+                tracker.add(len(chunk))
+        finally:
+            tracker.finish()
+            await _run(file.close)
+
+
+async def download_file(
+    session: aiohttp.ClientSession,
+    url: str,
+    path: str,
+    size: typing.Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    retry_count: int = 5,
+    retry_delay: float = 1.0,
+    progress: typing.Optional[helpers.ProgressCallback] = None,
+    stats: typing.Optional[helpers.TransferStats] = None,
+) -> str:
+    """
+    Downloads url to path by chunks. Data is written to "<path>.part" first, an interrupted download
+    is resumed from it with HTTP Range. The file is skipped, if it already exists (and has `size`).
+    (Загружает файл по частям с возобновлением через HTTP Range. Существующие файлы пропускаются.)
+
+    :param session: Session to use (Сессия aiohttp)
+    :param url: URL of the file (URL файла)
+    :param path: Destination path (Путь для сохранения)
+    :param size: Expected size in bytes, the result is verified against it (Ожидаемый размер в байтах)
+    :param chunk_size: Size of chunks in bytes (Размер части в байтах)
+    :param retry_count: Number of attempts (Количество попыток)
+    :param retry_delay: Delay between attempts (Задержка между попытками)
+    :param progress: Called with helpers.TransferProgress while the file is downloaded
+     (Функция отслеживания прогресса загрузки)
+    :param stats: Stats to add received bytes to (Статистика передачи)
+    :raises OkDeskError: if the server refused the download or the size does not match
+     (если сервер отказал в загрузке или размер не совпадает)
+    :return: path
+    """
+    existing_size = await _run(_file_size, path)
+    if existing_size is not None and (size is None or existing_size == size):
+        return path
+    part_path = path + PART_SUFFIX
+    retry_count = max(retry_count, 1)
+    for retry_num in range(1, retry_count + 1):
+        try:
+            await _download_part(
+                session, url, part_path, size, chunk_size, progress, stats
+            )
+            written = await _run(_file_size, part_path) or 0
+            if size is not None and written < size:
+                raise aiohttp.ClientPayloadError(
+                    f"Download of {url} ended after {written} of {size} bytes"
+                )
+            break
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if retry_num == retry_count:
+                raise
+            await asyncio.sleep(retry_delay)
+    if size is not None and written != size:
+        await _run(_remove, part_path)
+        raise OkDeskError([f"Downloaded {written} bytes of {url}, expected {size}"])
+    await _run(os.replace, part_path, path)
+    return path
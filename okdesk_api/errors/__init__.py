@@ -1 +1 @@
-from .errors import OkDeskError
+from .errors import OkDeskError, PartialUploadError
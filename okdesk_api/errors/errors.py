@@ -1,3 +1,4 @@
+import os
 import typing
 
 
@@ -61,7 +62,7 @@ class OkDeskError(Exception):
     ):
         self.messages = []
         if isinstance(json_error, list):
-            self.messages = str(json_error)
+            self.messages = [str(error) for error in json_error]
         elif isinstance(json_error, dict):
             self.messages = dict_errors_to_errors(json_error)
         else:
@@ -69,3 +70,35 @@ class OkDeskError(Exception):
 
     def __str__(self):
         return "\n".join(self.messages)
+
+
+class PartialUploadError(OkDeskError):
+    """
+    Some files of a split upload failed after all retries, the other files were uploaded.
+    (Часть файлов не удалось загрузить, остальные файлы загружены.)
+
+    failed - list of (attachment, exception) of the files, which were not uploaded, the message has only file names
+    result - merged result of the successful requests, None if there were none
+    """
+
+    def __init__(
+        self,
+        failed: typing.List[typing.Tuple[typing.Any, BaseException]],
+        result: typing.Any = None,
+    ):
+        super().__init__(
+            [f"{_attachment_name(attachment)}: {error}" for attachment, error in failed]
+        )
+        self.failed = failed
+        self.result = result
+
+
+def _attachment_name(attachment: dict) -> str:
+    # the file name, not the content: bytes of a file may take megabytes
+    source = attachment["attachment"]
+    name = attachment.get("filename")
+    if name is None and isinstance(source, (str, os.PathLike)):
+        name = os.path.basename(source)
+    if name is None and isinstance(getattr(source, "name", None), str):
+        name = os.path.basename(source.name)
+    return name or f"<{type(source).__name__}>"
@@ -1,5 +1,6 @@
 from .helpers import (
     convert_param,
+    convert_parameter_value,
     convert_additional_attributes_filter,
     AttributeFilter,
     AttributeFilterCheckbox,
@@ -9,9 +10,28 @@ from .helpers import (
     AttributeFilterMultiselect,
     AttributeFilterString,
 )
+from .timestamps import (
+    get_timezone,
+    parse_datetime,
+    parse_epoch,
+    set_timezone_interning,
+)
+from .durations import parse_duration, parse_durations
+from .multipart import (
+    FileSource,
+    MultipartForm,
+    MultipartFile,
+    skip_duplicate_attachments,
+    group_attachments,
+    AttachmentSnapshot,
+    snapshot_attachments,
+    rewind_attachments,
+)
+from .progress import ProgressCallback, ProgressTracker, TransferProgress, TransferStats
 
 __all__ = [
     "convert_param",
+    "convert_parameter_value",
     "convert_additional_attributes_filter",
     "AttributeFilter",
     "AttributeFilterCheckbox",
@@ -20,4 +40,22 @@ __all__ = [
     "AttributeFilterSelect",
     "AttributeFilterMultiselect",
     "AttributeFilterString",
+    "get_timezone",
+    "parse_datetime",
+    "parse_epoch",
+    "set_timezone_interning",
+    "parse_duration",
+    "parse_durations",
+    "MultipartForm",
+    "MultipartFile",
+    "FileSource",
+    "skip_duplicate_attachments",
+    "group_attachments",
+    "AttachmentSnapshot",
+    "snapshot_attachments",
+    "rewind_attachments",
+    "ProgressCallback",
+    "ProgressTracker",
+    "TransferProgress",
+    "TransferStats",
 ]
@@ -0,0 +1,77 @@
+import functools
+import re
+import typing
+
+# one part of "134 д., 14 ч., 57 м.": number and unit. Parts are matched one by one from a known
+# position, a single regex with optional parts backtracks badly on long invalid strings
+_PART_RE = re.compile(r"(\d+)\s*(д|ч|мин|м|сек|с)\.?")
+_SEPARATOR_RE = re.compile(r"[\s,]*")
+_UNIT_SECONDS = {"д": 86400, "ч": 3600, "мин": 60, "м": 60, "сек": 1, "с": 1}
+# units must follow in this order, every unit at most once
+_UNIT_ORDER = {"д": 0, "ч": 1, "мин": 2, "м": 2, "сек": 3, "с": 3}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_duration(value: str) -> int:
+    end = len(value)
+    position = _SEPARATOR_RE.match(value).end()
+    if position == end:
+        raise ValueError(f"Invalid duration: {value!r}")
+    seconds = 0
+    last_order = -1
+    while position < end:
+        match = _PART_RE.match(value, position)
+        if match is None or _UNIT_ORDER[match.group(2)] <= last_order:
+            raise ValueError(f"Invalid duration: {value!r}")
+        last_order = _UNIT_ORDER[match.group(2)]
+        seconds += int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+        position = _SEPARATOR_RE.match(value, match.end()).end()
+    return seconds
+
+
+def parse_duration(
+    value: typing.Optional[str], strict: bool = True
+) -> typing.Optional[int]:
+    """
+    Parses OkDesk duration string into seconds. Repeated values are parsed once.
+    (Разбирает строку длительности OkDesk в секунды.)
+
+    >>> parse_duration("134 д., 14 ч., 57 м.")
+    11631420
+    >>> parse_duration(" " * 100000 + "x", strict=False) is None  # rejected in linear time
+    True
+
+    :param value: Duration string, e.g. "134 д., 14 ч., 57 м." (Строка длительности)
+    :param strict: If False, None is returned for unknown formats instead of raising ValueError
+     (Если False, для неизвестного формата возвращается None)
+    :raises ValueError: if strict and the format is unknown (если формат неизвестен)
+    :return: Seconds, or None if value is empty
+    """
+    if not value:
+        return None
+    if strict:
+        return _parse_duration(value)
+    try:
+        return _parse_duration(value)
+    except ValueError:
+        return None
+
+
+def parse_durations(
+    values: typing.Iterable[typing.Optional[str]], strict: bool = False
+) -> typing.List[typing.Optional[int]]:
+    """
+    Parses many duration strings into seconds, every distinct string is parsed once.
+    Values in unknown format are None, so one bad value doesn't fail the whole batch.
+    (Разбирает набор строк длительности в секунды. Значения в неизвестном формате - None.)
+
+    :param strict: If True, ValueError is raised for unknown formats (Если True, для неизвестного формата вызывается ValueError)
+    """
+    parsed = {}
+    result = []
+    for value in values:
+        seconds = parsed.get(value)
+        if seconds is None and value not in parsed:
+            seconds = parsed[value] = parse_duration(value, strict)
+        result.append(seconds)
+    return result
@@ -1,6 +1,7 @@
 import datetime
 import typing
 import enum
+from .timestamps import parse_datetime
 
 
 class AttributeFilterType(enum.Enum):
@@ -155,3 +156,36 @@ def convert_param(param) -> str:
         return param
     else:
         return str(param)
+
+
+def convert_parameter_value(field_type: str, value: typing.Any) -> typing.Any:
+    """
+    Converts value of custom parameter from API response according to its field_type.
+    Values, which can't be converted, are returned as is.
+    (Преобразует значение дополнительного атрибута в соответствии с его типом.)
+
+    ftdate -> datetime.date, ftdatetime -> datetime.datetime, ftcheckbox -> bool,
+    ftmultiselect -> list, other types are returned as is
+    """
+    if value is None or value == "":
+        return [] if field_type == AttributeFilterType.MULTISELECT.value else None
+    try:
+        if field_type == AttributeFilterType.DATE.value:
+            if isinstance(value, str):
+                if "." in value:
+                    return datetime.datetime.strptime(value, "%d.%m.%Y").date()
+                return datetime.date.fromisoformat(value[:10])
+        elif field_type == AttributeFilterType.DATETIME.value:
+            if isinstance(value, str):
+                return parse_datetime(value)
+        elif field_type == AttributeFilterType.CHECKBOX.value:
+            if isinstance(value, str):
+                return value.lower() in ("true", "1")
+            return bool(value)
+        elif field_type == AttributeFilterType.MULTISELECT.value:
+            if isinstance(value, (list, tuple)):
+                return list(value)
+            return [value]
+    except ValueError:
+        pass
+    return value
@@ -0,0 +1,447 @@
+import asyncio
+import hashlib
+import mimetypes
+import os
+import typing
+
+import aiohttp
+
+from .helpers import convert_param
+from .progress import ProgressCallback
+
+# size of chunks, read from file objects
+CHUNK_SIZE = 2**16
+
+# path, bytes-like object, binary file object or async iterator of bytes
+FileSource = typing.Union[
+    str,
+    os.PathLike,
+    bytes,
+    bytearray,
+    memoryview,
+    typing.BinaryIO,
+    typing.AsyncIterable[bytes],
+]
+
+
+class MultipartFile:
+    """
+    File part of MultipartForm. (Файл в составе MultipartForm.)
+
+    Paths are opened for every attempt and closed after it. File objects are owned by the caller,
+    they are rewound to their initial position before every attempt if they are seekable.
+    Async iterators can be sent only once, so requests with them are not retried.
+    (Пути открываются для каждой попытки. Файловые объекты закрывает вызывающий код.
+    Асинхронные итераторы можно отправить только один раз.)
+    """
+
+    __slots__ = ("name", "source", "filename", "content_type", "_position", "_sent")
+
+    def __init__(
+        self,
+        name: str,
+        source: FileSource,
+        filename: typing.Optional[str] = None,
+        content_type: typing.Optional[str] = None,
+    ):
+        if isinstance(source, (str, os.PathLike)):
+            filename = filename or os.path.basename(source)
+        elif filename is None:
+            filename = getattr(source, "name", None)
+            if not isinstance(filename, str):
+                raise ValueError(f"filename is required for {name}")
+            filename = os.path.basename(filename)
+        if not isinstance(
+            source, (str, os.PathLike, bytes, bytearray, memoryview)
+        ) and not (hasattr(source, "read") or hasattr(source, "__aiter__")):
+            raise TypeError(f"Unsupported attachment type {type(source).__name__}")
+        self.name = name
+        self.source = source
+        self.filename = filename
+        # guessed when the file is opened, mimetypes may read system files on the first call
+        self.content_type = content_type
+        self._position: typing.Optional[int] = None
+        self._sent = False
+
+    def open(self) -> typing.Tuple[typing.Any, typing.Optional[typing.BinaryIO]]:
+        """
+        Returns value for aiohttp.FormData and a file handle to close after sending (or None),
+        blocking (Возвращает значение для aiohttp.FormData и файл, который нужно закрыть)
+        """
+        if self.content_type is None:
+            self.content_type = mimetypes.guess_type(self.filename)[0]
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            if not os.path.isfile(source):
+                raise FileNotFoundError(f"File {source} not found in the filesystem")
+            handle = open(source, "rb")
+            return handle, handle
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return source, None
+        if hasattr(source, "read"):
+            if source.seekable():
+                if self._position is None:
+                    self._position = source.tell()
+                else:
+                    source.seek(self._position)
+            elif self._sent:
+                raise ValueError(f"File object of {self.name} can not be sent twice")
+            self._sent = True
+            # aiohttp closes file objects after sending, the caller's one is read by chunks instead
+            return _read_chunks(source), None
+        if self._sent:
+            raise ValueError(f"Async iterator of {self.name} can not be sent twice")
+        self._sent = True
+        return source, None
+
+    def can_resend(self) -> bool:
+        """
+        Returns True if the file can be opened again: paths, bytes, seekable file objects
+        and sources, which were not sent yet (Можно ли отправить файл еще раз)
+        """
+        if not self._sent:
+            return True
+        return hasattr(self.source, "read") and self.source.seekable()
+
+    def size(self) -> typing.Optional[int]:
+        """
+        Returns size of the file in bytes, None for async iterators and non-seekable file objects,
+        blocking (Возвращает размер файла в байтах, блокирующий вызов)
+        """
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.getsize(source) if os.path.isfile(source) else None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return memoryview(source).nbytes
+        if hasattr(source, "read") and source.seekable():
+            position = source.tell()
+            try:
+                return source.seek(0, os.SEEK_END) - position
+            finally:
+                source.seek(position)
+        return None
+
+    def digest(self, algorithm: str) -> typing.Optional[str]:
+        """
+        Returns hex digest of the content (see hashlib.new), None if the content can't be re-read,
+        blocking (Возвращает хэш содержимого, блокирующий вызов)
+        """
+        hasher = hashlib.new(algorithm)
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            hasher.update(source)
+            return hasher.hexdigest()
+        if isinstance(source, (str, os.PathLike)):
+            if not os.path.isfile(source):
+                return None
+            with open(source, "rb") as file:
+                for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+        if hasattr(source, "read") and source.seekable():
+            position = source.tell()
+            try:
+                for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+            finally:
+                source.seek(position)
+            return hasher.hexdigest()
+        return None
+
+    def __repr__(self):
+        return f"MultipartFile(name={self.name!r}, filename={self.filename!r})"
+
+
+class MultipartForm:
+    """
+    Description of a multipart/form-data body. Requests return it as "data" from to_request,
+    the client turns it into aiohttp.FormData for every attempt, so files are streamed in chunks
+    and are never loaded into memory.
+    (Описание тела multipart/form-data. Файлы передаются частями, не загружаясь в память целиком.)
+    """
+
+    __slots__ = ("fields", "files", "progress")
+
+    def __init__(self, progress: typing.Optional[ProgressCallback] = None):
+        """
+        :param progress: Called with TransferProgress while the body is sent, every attempt starts from 0
+         (Вызывается с TransferProgress во время отправки)
+        """
+        self.fields: typing.List[typing.Tuple[str, str]] = []
+        self.files: typing.List[MultipartFile] = []
+        self.progress = progress
+
+    def __repr__(self):
+        return f"MultipartForm(fields={self.fields!r}, files={self.files!r})"
+
+    def add_field(self, name: str, value: typing.Any):
+        """
+        Adds a form field, lists and tuples are added as repeated fields.
+        (Добавляет поле формы, списки добавляются как повторяющиеся поля.)
+        """
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                self.add_field(name, item)
+            return
+        self.fields.append((name, convert_param(value)))
+
+    def add_file(
+        self,
+        name: str,
+        source: FileSource,
+        filename: typing.Optional[str] = None,
+        content_type: typing.Optional[str] = None,
+    ):
+        """
+        Adds a file. Paths are checked and opened only when the form is sent.
+        (Добавляет файл. Файлы по пути открываются только при отправке формы.)
+
+        :param name: Form field name (Имя поля формы)
+        :param source: Path, bytes/memoryview, binary file object or async iterator of bytes
+         (Путь, байты, двоичный файловый объект или асинхронный итератор байтов)
+        :param filename: File name sent to the server, required for bytes and async iterators,
+         base name of the path or file object name by default (Имя файла)
+        :param content_type: MIME type, guessed from the file name by default (MIME тип)
+        """
+        self.files.append(MultipartFile(name, source, filename, content_type))
+
+    def can_resend(self) -> bool:
+        """
+        Returns True if the form can be sent by one more attempt (Можно ли отправить форму еще раз)
+        """
+        return all(file.can_resend() for file in self.files)
+
+    def _open_files(self) -> typing.Tuple[list, typing.List[typing.BinaryIO]]:
+        values = []
+        handles = []
+        try:
+            for file in self.files:
+                value, handle = file.open()
+                values.append(value)
+                if handle is not None:
+                    handles.append(handle)
+        except BaseException:
+            _close_files(handles)
+            raise
+        return values, handles
+
+    async def open(
+        self,
+    ) -> typing.Tuple[aiohttp.FormData, typing.List[typing.BinaryIO]]:
+        """
+        Opens the files in the default executor, so the event loop is not blocked, and creates
+        aiohttp.FormData, which streams them. FormData can be sent only once, so a new one is
+        opened for every attempt. Returned handles must be closed with `close` after sending.
+        (Открывает файлы вне цикла событий и создает aiohttp.FormData для одной попытки отправки.
+        Возвращенные файлы нужно закрыть через `close` после отправки.)
+
+        :raises FileNotFoundError: if a file does not exist (если файл не найден)
+        :raises ValueError: if a non-seekable source is sent again (если источник нельзя отправить повторно)
+        """
+        loop = asyncio.get_running_loop()
+        values, handles = await loop.run_in_executor(None, self._open_files)
+        form = aiohttp.FormData(quote_fields=False)
+        for name, value in self.fields:
+            form.add_field(name, value)
+        for file, value in zip(self.files, values):
+            form.add_field(
+                file.name,
+                value,
+                filename=file.filename,
+                content_type=file.content_type,
+            )
+        return form, handles
+
+    @staticmethod
+    async def close(handles: typing.List[typing.BinaryIO]):
+        """
+        Closes files, returned by `open`, in the default executor. (Закрывает файлы, открытые `open`.)
+        """
+        if handles:
+            await asyncio.get_running_loop().run_in_executor(
+                None, _close_files, handles
+            )
+
+
+def _close_files(handles: typing.List[typing.BinaryIO]):
+    for handle in handles:
+        handle.close()
+
+
+def _skip_duplicates(
+    attachments: typing.List[dict],
+    existing: typing.List[typing.Any],
+    hash_algorithm: typing.Optional[str],
+) -> typing.List[dict]:
+    existing_keys = {
+        (attachment.attachment_file_name, attachment.attachment_file_size)
+        for attachment in existing
+    }
+    seen = set()
+    result = []
+    for attachment in attachments:
+        file = MultipartFile("", attachment["attachment"], attachment.get("filename"))
+        size = file.size()
+        if size is None:
+            # size of streams is unknown, they are always uploaded
+            result.append(attachment)
+            continue
+        if (file.filename, size) in existing_keys:
+            continue
+        digest = file.digest(hash_algorithm) if hash_algorithm is not None else None
+        if digest is not None:
+            key = (file.filename, size, digest)
+        else:
+            # without a hash only the same file is a repeat, not another one of the same name and size
+            key = _source_key(file.source)
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(attachment)
+    return result
+
+
+def _source_key(source: FileSource) -> tuple:
+    if isinstance(source, (str, os.PathLike)):
+        return ("path", os.path.realpath(source))
+    # attachments keep their sources alive, so ids are not reused while the list is checked
+    return ("object", id(source))
+
+
+async def skip_duplicate_attachments(
+    attachments: typing.List[dict],
+    existing: typing.Iterable[typing.Any] = (),
+    hash_algorithm: typing.Optional[str] = None,
+) -> typing.List[dict]:
+    """
+    Returns attachments (types.Attachment dicts) without the files, which are already attached to the target
+    (same name and size as one of `existing`) or repeat an earlier file of the list: the same path or object,
+    or, if `hash_algorithm` is set, the same name, size and content hash. The API does not return hashes
+    of attached files, so `existing` is compared by name and size only. Files are inspected in the default executor.
+    (Возвращает вложения без файлов, уже прикрепленных к объекту (то же имя и размер),
+    и без повторов в самом списке.)
+
+    :param attachments: Files to upload (Файлы для загрузки)
+    :param existing: Already attached files, e.g. MaintanceEntity.attachments or Issue.attachments
+     (Уже прикрепленные файлы)
+    :param hash_algorithm: hashlib algorithm to compare files of the list by content, e.g. "sha256"
+     (Алгоритм хэширования для сравнения файлов списка по содержимому)
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, _skip_duplicates, list(attachments), list(existing or ()), hash_algorithm
+    )
+
+
+def _group_by_size(
+    attachments: typing.List[dict], bucket_size: typing.Optional[int]
+) -> typing.List[typing.List[dict]]:
+    if bucket_size is None:
+        return [[attachment] for attachment in attachments]
+    groups = []
+    group = []
+    group_size = 0
+    for attachment in attachments:
+        size = MultipartFile(
+            "", attachment["attachment"], attachment.get("filename")
+        ).size()
+        if size is None:
+            # streams of unknown size are sent alone
+            groups.append([attachment])
+            continue
+        if group and group_size + size > bucket_size:
+            groups.append(group)
+            group = []
+            group_size = 0
+        group.append(attachment)
+        group_size += size
+    if group:
+        groups.append(group)
+    return groups
+
+
+async def group_attachments(
+    attachments: typing.List[dict], bucket_size: typing.Optional[int] = None
+) -> typing.List[typing.List[dict]]:
+    """
+    Splits attachments (types.Attachment dicts) into groups for separate requests: one file per group,
+    or consecutive files up to `bucket_size` bytes in total. A file larger than bucket_size forms its own group.
+    Sizes are read in the default executor.
+    (Разбивает вложения на группы для отдельных запросов: по одному файлу или до bucket_size байт.)
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, _group_by_size, list(attachments), bucket_size
+    )
+
+
+class AttachmentSnapshot(typing.NamedTuple):
+    """
+    State of a file before its upload, see `snapshot_attachments`.
+    (Состояние файла перед отправкой.)
+    """
+
+    filename: str
+    size: int
+    # start position of a file object, None for paths and bytes
+    position: typing.Optional[int]
+
+
+def _snapshot(
+    attachments: typing.List[dict],
+) -> typing.Optional[typing.List[AttachmentSnapshot]]:
+    snapshot = []
+    for attachment in attachments:
+        source = attachment["attachment"]
+        file = MultipartFile("", source, attachment.get("filename"))
+        position = None
+        if not isinstance(source, (str, os.PathLike, bytes, bytearray, memoryview)):
+            if not (hasattr(source, "read") and source.seekable()):
+                return None
+            position = source.tell()
+        size = file.size()
+        if size is None:
+            return None
+        snapshot.append(AttachmentSnapshot(file.filename, size, position))
+    return snapshot
+
+
+def _rewind(attachments: typing.List[dict], snapshot: typing.List[AttachmentSnapshot]):
+    for attachment, state in zip(attachments, snapshot):
+        if state.position is not None:
+            attachment["attachment"].seek(state.position)
+
+
+async def snapshot_attachments(
+    attachments: typing.List[dict],
+) -> typing.Optional[typing.List[AttachmentSnapshot]]:
+    """
+    Returns name, size and start position of every file, if all of them can be sent again
+    in another request (paths, bytes and seekable file objects), otherwise None.
+    Files are inspected in the default executor.
+    (Возвращает имя, размер и начальную позицию файлов, если все их можно отправить повторно, иначе None.)
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, _snapshot, list(attachments)
+    )
+
+
+async def rewind_attachments(
+    attachments: typing.List[dict], snapshot: typing.List[AttachmentSnapshot]
+):
+    """
+    Moves file objects back to the positions of `snapshot_attachments`, so they can be sent again.
+    (Возвращает файловые объекты к начальным позициям.)
+    """
+    await asyncio.get_running_loop().run_in_executor(
+        None, _rewind, list(attachments), snapshot
+    )
+
+
+async def _read_chunks(
+    file: typing.BinaryIO, chunk_size: int = CHUNK_SIZE
+) -> typing.AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    while True:
+        chunk = await loop.run_in_executor(None, file.read, chunk_size)
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,109 @@
+import time
+import typing
+
+
+class TransferProgress(typing.NamedTuple):
+    """
+    State of an upload or download, passed to progress callbacks.
+    (Состояние загрузки, передаваемое в функцию отслеживания прогресса.)
+    """
+
+    # bytes sent or received, including the resumed part of a download
+    transferred: int
+    # total size in bytes, None if unknown
+    total: typing.Optional[int]
+    # bytes per second since the start of the attempt
+    rate: float
+
+
+ProgressCallback = typing.Callable[[TransferProgress], typing.Any]
+
+
+class TransferStats:
+    """
+    Aggregated upload/download throughput of a client (OkDeskClient.transfer_stats).
+    Multipart uploads and attachment downloads are counted, time is the sum of transfer durations.
+    (Суммарная статистика передачи файлов клиента.)
+    """
+
+    __slots__ = ("bytes_sent", "bytes_received", "upload_time", "download_time")
+
+    def __init__(self):
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.upload_time = 0.0
+        self.download_time = 0.0
+
+    @property
+    def upload_rate(self) -> float:
+        """Average upload rate, bytes per second (Средняя скорость отправки, байт в секунду)"""
+        return self.bytes_sent / self.upload_time if self.upload_time else 0.0
+
+    @property
+    def download_rate(self) -> float:
+        """Average download rate, bytes per second (Средняя скорость загрузки, байт в секунду)"""
+        return self.bytes_received / self.download_time if self.download_time else 0.0
+
+    def reset(self):
+        self.__init__()
+
+    def __repr__(self):
+        return (
+            f"TransferStats(bytes_sent={self.bytes_sent}, bytes_received={self.bytes_received}, "
+            f"upload_rate={self.upload_rate:.0f}, download_rate={self.download_rate:.0f})"
+        )
+
+
+class ProgressTracker:
+    """
+    Counts bytes of one transfer attempt, calls the callback and updates stats.
+    (Отслеживает одну попытку передачи.)
+    """
+
+    __slots__ = (
+        "callback",
+        "total",
+        "transferred",
+        "stats",
+        "upload",
+        "_initial",
+        "_started",
+    )
+
+    def __init__(
+        self,
+        callback: typing.Optional[ProgressCallback],
+        total: typing.Optional[int],
+        stats: typing.Optional[TransferStats] = None,
+        upload: bool = True,
+        transferred: int = 0,
+    ):
+        self.callback = callback
+        self.total = total
+        self.transferred = transferred
+        self.stats = stats
+        self.upload = upload
+        self._initial = transferred
+        self._started = time.monotonic()
+
+    def add(self, size: int):
+        self.transferred += size
+        if self.stats is not None:
+            if self.upload:
+                self.stats.bytes_sent += size
+            else:
+                self.stats.bytes_received += size
+        if self.callback is not None:
+            elapsed = time.monotonic() - self._started
+            rate = (self.transferred - self._initial) / elapsed if elapsed else 0.0
+            self.callback(TransferProgress(self.transferred, self.total, rate))
+
+    def finish(self):
+        """Adds duration of the attempt to stats (Учитывает длительность попытки)"""
+        if self.stats is None:
+            return
+        elapsed = time.monotonic() - self._started
+        if self.upload:
+            self.stats.upload_time += elapsed
+        else:
+            self.stats.download_time += elapsed
@@ -0,0 +1,142 @@
+import datetime
+import typing
+
+# OkDesk always sends timestamps as "2016-03-15T18:05:17.568+03:00"
+_OKDESK_FORMAT_LENGTH = 29
+_MAX_INTERNED_TIMEZONES = 256
+
+_fromisoformat = datetime.datetime.fromisoformat
+_datetime = datetime.datetime
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_timezones_by_offset: typing.Dict[datetime.timedelta, datetime.tzinfo] = {
+    datetime.timedelta(0): datetime.timezone.utc
+}
+_timezones_by_suffix: typing.Dict[str, datetime.tzinfo] = {
+    "Z": datetime.timezone.utc,
+    "+00:00": datetime.timezone.utc,
+}
+_offsets_by_suffix: typing.Dict[str, int] = {}
+# default of parse_datetime(intern_timezone=None), see set_timezone_interning
+_intern_by_default = False
+
+
+def set_timezone_interning(enabled: bool):
+    """
+    Makes parse_datetime share tzinfo objects by default, including datetime fields of all models
+    (Issue, Attachment, Comment, ...). Worth it when many parsed models are kept in memory.
+    (Включает переиспользование объектов часовых поясов по умолчанию, в том числе для моделей.)
+
+    :param enabled: Share tzinfo objects by UTC offset (Переиспользовать объекты часовых поясов)
+    """
+    global _intern_by_default
+    _intern_by_default = bool(enabled)
+
+
+def get_timezone(offset: datetime.timedelta) -> datetime.tzinfo:
+    """
+    Returns shared tzinfo object for the given UTC offset.
+    (Возвращает общий объект tzinfo для заданного смещения от UTC.)
+
+    :param offset: UTC offset (Смещение от UTC)
+    """
+    tz = _timezones_by_offset.get(offset)
+    if tz is None:
+        tz = datetime.timezone(offset)
+        if len(_timezones_by_offset) < _MAX_INTERNED_TIMEZONES:
+            _timezones_by_offset[offset] = tz
+    return tz
+
+
+def _timezone_for_suffix(suffix: str) -> datetime.tzinfo:
+    tz = _timezones_by_suffix.get(suffix)
+    if tz is None:
+        tz = get_timezone(_fromisoformat("2000-01-01T00:00:00" + suffix).utcoffset())
+        if len(_timezones_by_suffix) < _MAX_INTERNED_TIMEZONES:
+            _timezones_by_suffix[suffix] = tz
+    return tz
+
+
+def _offset_seconds(suffix: str) -> int:
+    seconds = _offsets_by_suffix.get(suffix)
+    if seconds is None:
+        seconds = int(_timezone_for_suffix(suffix).utcoffset(None).total_seconds())
+        if len(_offsets_by_suffix) < _MAX_INTERNED_TIMEZONES:
+            _offsets_by_suffix[suffix] = seconds
+    return seconds
+
+
+def _parse(value: str) -> datetime.datetime:
+    try:
+        return _fromisoformat(value)
+    except ValueError:
+        if value[-1] != "Z":
+            raise
+    # fromisoformat accepts "Z" only since python 3.11
+    return _fromisoformat(value[:-1] + "+00:00")
+
+
+def parse_datetime(
+    value: typing.Optional[str], intern_timezone: typing.Optional[bool] = None
+) -> typing.Optional[datetime.datetime]:
+    """
+    Parses ISO-8601 timestamp returned by OkDesk, as fast as datetime.fromisoformat.
+    With intern_timezone, timezones are shared between all parsed values with the same UTC offset:
+    about 4x slower, but a batch of values takes about half of the memory
+    (see benchmarks/bench_timestamps.py), which pays off for values kept in memory for long.
+    (Разбирает метку времени ISO-8601 из ответа OkDesk. С intern_timezone объекты часовых поясов
+    переиспользуются: медленнее, но требует примерно вдвое меньше памяти.)
+
+    :param value: Timestamp string, e.g. "2016-03-15T18:05:17.568+03:00" (Строка с датой и временем)
+    :param intern_timezone: Share tzinfo objects by UTC offset, set_timezone_interning() value by default
+     (Переиспользовать объекты часовых поясов)
+    :return: Aware datetime, naive datetime if value has no offset, or None if value is empty
+    """
+    if not value:
+        return None
+    if not (_intern_by_default if intern_timezone is None else intern_timezone):
+        return _parse(value)
+    if len(value) == _OKDESK_FORMAT_LENGTH and value[23] in "+-":
+        # fast path for the fixed OkDesk format, the naive part doesn't allocate a timezone
+        parsed = _fromisoformat(value[:23])
+        return _datetime(
+            parsed.year,
+            parsed.month,
+            parsed.day,
+            parsed.hour,
+            parsed.minute,
+            parsed.second,
+            parsed.microsecond,
+            _timezone_for_suffix(value[23:]),
+        )
+    parsed = _parse(value)
+    offset = parsed.utcoffset()
+    if offset is None:
+        return parsed
+    return parsed.replace(tzinfo=get_timezone(offset))
+
+
+def parse_epoch(value: typing.Optional[str]) -> typing.Optional[int]:
+    """
+    Parses ISO-8601 timestamp returned by OkDesk into UTC epoch seconds.
+    Values without offset are treated as UTC.
+    (Разбирает метку времени ISO-8601 в количество секунд с начала эпохи UTC.)
+
+    :param value: Timestamp string, e.g. "2016-03-15T18:05:17.568+03:00" (Строка с датой и временем)
+    :return: Epoch seconds, or None if value is empty
+    """
+    if not value:
+        return None
+    if len(value) == _OKDESK_FORMAT_LENGTH and value[23] in "+-":
+        # computed from the naive part, which is cheaper than datetime.timestamp()
+        parsed = _fromisoformat(value[:23])
+        return (
+            (parsed.toordinal() - _EPOCH_ORDINAL) * 86400
+            + parsed.hour * 3600
+            + parsed.minute * 60
+            + parsed.second
+            - _offset_seconds(value[23:])
+        )
+    parsed = _parse(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return int(parsed.timestamp())
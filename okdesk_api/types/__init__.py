@@ -1,6 +1,8 @@
 from .types import (
     ApiRequest,
     OkDeskBaseClass,
+    Field,
+    ParametersMixin,
     IdNamePair,
     Category,
     Attachment,
@@ -9,10 +11,22 @@ from .types import (
     IdNameTypePair,
     CodeIdNamePair,
 )
+from .id_set import IdSet
+from .serialization import dumps, loads
+from .interning import (
+    FrozenDict,
+    intern_str,
+    intern_dict,
+    intern_dict_list,
+    intern_model,
+    clear_interned,
+)
 
 __all__ = [
     "ApiRequest",
     "OkDeskBaseClass",
+    "Field",
+    "ParametersMixin",
     "IdNamePair",
     "Category",
     "Attachment",
@@ -20,4 +34,13 @@ __all__ = [
     "IdValuePair",
     "IdNameTypePair",
     "CodeIdNamePair",
+    "IdSet",
+    "dumps",
+    "loads",
+    "FrozenDict",
+    "intern_str",
+    "intern_dict",
+    "intern_dict_list",
+    "intern_model",
+    "clear_interned",
 ]
@@ -0,0 +1,105 @@
+import array
+import bisect
+import typing
+
+
+class IdSet:
+    """
+    Compact immutable set of integer ids, stored as a sorted array of signed 64-bit ints (8 bytes per id).
+    Supports membership, iteration (in ascending order), union, intersection and difference.
+    (Компактное неизменяемое множество целочисленных ID, хранящееся как отсортированный массив int64.)
+
+    >>> IdSet([3, 1, 2, 3]) & IdSet([2, 3, 4])
+    IdSet([2, 3])
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: typing.Iterable[int] = ()):
+        if isinstance(ids, IdSet):
+            self._ids = ids._ids
+            return
+        self._ids = array.array("q", sorted(set(ids)))
+
+    @classmethod
+    def _from_sorted(cls, ids: typing.Iterable[int]) -> "IdSet":
+        # ids must already be sorted and unique
+        instance = cls.__new__(cls)
+        instance._ids = array.array("q", ids)
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self._ids)
+
+    def __contains__(self, item) -> bool:
+        index = bisect.bisect_left(self._ids, item)
+        return index < len(self._ids) and self._ids[index] == item
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IdSet):
+            return self._ids == other._ids
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._ids.tobytes())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._ids.tolist()!r})"
+
+    def __reduce__(self):
+        return self.__class__._from_sorted, (self._ids,)
+
+    @staticmethod
+    def _coerce(other) -> "IdSet":
+        return other if isinstance(other, IdSet) else IdSet(other)
+
+    def union(self, *others: typing.Iterable[int]) -> "IdSet":
+        result = set(self._ids)
+        for other in others:
+            result.update(self._coerce(other)._ids)
+        return self._from_sorted(sorted(result))
+
+    def intersection(self, *others: typing.Iterable[int]) -> "IdSet":
+        result = self
+        for other in others:
+            other = self._coerce(other)
+            small, large = sorted((result, other), key=len)
+            lookup = set(large._ids)
+            # iterating over the sorted smaller side keeps the result sorted
+            result = self._from_sorted(i for i in small._ids if i in lookup)
+        return result
+
+    def difference(self, *others: typing.Iterable[int]) -> "IdSet":
+        lookup = set()
+        for other in others:
+            lookup.update(self._coerce(other)._ids)
+        return self._from_sorted(i for i in self._ids if i not in lookup)
+
+    def symmetric_difference(self, other: typing.Iterable[int]) -> "IdSet":
+        return self._from_sorted(
+            sorted(set(self._ids).symmetric_difference(self._coerce(other)._ids))
+        )
+
+    def issubset(self, other: typing.Iterable[int]) -> bool:
+        other = self._coerce(other)
+        return len(self) <= len(other) and all(i in other for i in self._ids)
+
+    def issuperset(self, other: typing.Iterable[int]) -> bool:
+        return self._coerce(other).issubset(self)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __xor__ = symmetric_difference
+    __le__ = issubset
+    __ge__ = issuperset
+
+    def to_list(self) -> typing.List[int]:
+        return self._ids.tolist()
+
+    def to_array(self) -> array.array:
+        """Returns a copy of the underlying array('q')"""
+        return array.array("q", self._ids)
@@ -0,0 +1,133 @@
+import sys
+import typing
+
+# upper bound for every pool, so long-running processes don't grow it forever
+MAX_POOL_SIZE = 10000
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+class FrozenDict(dict):
+    """
+    Immutable, hashable dict. Returned by `intern_dict` for small reference objects
+    (status, priority, assignee, etc.), so identical objects are shared between models.
+    (Неизменяемый хэшируемый словарь для общих справочных объектов.)
+    """
+
+    __slots__ = ("_hash",)
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict.__repr__(self)})"
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+_dict_pool: typing.Dict[tuple, FrozenDict] = {}
+_model_pool: typing.Dict[tuple, typing.Any] = {}
+
+
+def _pool_key(value: dict) -> tuple:
+    # independent of the key order; value types are included, because 1, 1.0 and True are equal
+    return tuple(sorted((k, type(item), item) for k, item in value.items()))
+
+
+def intern_str(value: typing.Optional[str]) -> typing.Optional[str]:
+    """
+    Interns a short repeated string, such as status or priority code. (Интернирует строку)
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_dict(value: typing.Optional[dict]) -> typing.Optional[dict]:
+    """
+    Returns a shared FrozenDict equal to `value`. Only flat dicts with scalar values are interned,
+    anything else is returned as is.
+    (Возвращает общий неизменяемый экземпляр словаря, равный `value`.)
+
+    :param value: Reference dict from API response, e.g. {"code": "opened", "name": "Открыта"}
+    """
+    if type(value) is not dict:
+        return value
+    try:
+        key = _pool_key(value)
+        interned = _dict_pool.get(key)
+    except TypeError:
+        # unhashable (nested) values
+        return value
+    if interned is None:
+        if not all(isinstance(item, _SCALARS) for item in value.values()):
+            return value
+        interned = FrozenDict(
+            (sys.intern(k), intern_str(item)) for k, item in value.items()
+        )
+        if len(_dict_pool) < MAX_POOL_SIZE:
+            _dict_pool[key] = interned
+    return interned
+
+
+def intern_dict_list(
+    values: typing.Optional[typing.List[dict]],
+) -> typing.Optional[typing.List[dict]]:
+    """
+    Applies `intern_dict` to every item of the list. (Применяет `intern_dict` к каждому элементу списка)
+    """
+    if not values:
+        return values
+    return [intern_dict(value) for value in values]
+
+
+def intern_model(cls: type, data: typing.Optional[dict]) -> typing.Any:
+    """
+    Returns a shared frozen instance (see OkDeskBaseClass.freeze) of `cls.json_parse(data)`
+    for identical flat `data`. (Возвращает общий неизменяемый экземпляр модели для одинаковых данных.)
+
+    :param cls: OkDeskBaseClass subclass, e.g. IssueType
+    :param data: Raw dict from API response
+    """
+    if not data:
+        return None
+    try:
+        key = (cls,) + _pool_key(data)
+        instance = _model_pool.get(key)
+    except TypeError:
+        return cls.json_parse_frozen(data)
+    if instance is None:
+        instance = cls.json_parse_frozen(data)
+        if len(_model_pool) < MAX_POOL_SIZE:
+            _model_pool[key] = instance
+    return instance
+
+
+def clear_interned():
+    """
+    Drops all interned dicts and models. Already parsed models keep their references.
+    (Очищает пулы интернированных объектов.)
+    """
+    _dict_pool.clear()
+    _model_pool.clear()
@@ -0,0 +1,156 @@
+import functools
+import typing
+
+from .. import helpers
+from . import interning
+
+
+class Field:
+    """
+    Declares how a model field is read from the API response. Fields, which are not declared
+    in the model `_schema`, are copied from the key with the same name as is.
+    Parsers are applied to non-empty values only, empty values become None.
+    (Описание того, как поле модели читается из ответа API.)
+
+    :param source: Dotted path in the raw dict, e.g. "group.id" (field name by default)
+     (Путь к значению в исходном словаре)
+    :param datetime: Parse value with helpers.parse_datetime, which shares tzinfo objects after
+     helpers.set_timezone_interning(True) (Разобрать дату и время)
+    :param model: Nested model class, parsed with its json_parse (Вложенная модель)
+    :param container: "list" or "dict" if value is a list/dict of nested values
+     (Значение - список или словарь вложенных значений)
+    :param interned: Share identical values between models, see types.intern_dict / types.intern_model
+     (Использовать общие экземпляры для одинаковых значений)
+    :param parser: Custom function, converting non-empty raw value (Собственная функция разбора)
+    """
+
+    __slots__ = ("source", "datetime", "model", "container", "interned", "parser")
+
+    def __init__(
+        self,
+        source: typing.Optional[str] = None,
+        datetime: bool = False,
+        model: typing.Optional[type] = None,
+        container: typing.Optional[typing.Literal["list", "dict"]] = None,
+        interned: bool = False,
+        parser: typing.Optional[typing.Callable] = None,
+    ):
+        if container not in (None, "list", "dict"):
+            raise ValueError('container must be None, "list" or "dict"')
+        self.source = source
+        self.datetime = datetime
+        self.model = model
+        self.container = container
+        self.interned = interned
+        self.parser = parser
+
+    def __repr__(self):
+        return (
+            f"Field(source={self.source!r}, datetime={self.datetime!r}, model={self.model!r}, "
+            f"container={self.container!r}, interned={self.interned!r}, parser={self.parser!r})"
+        )
+
+    def item_parser(self) -> typing.Optional[typing.Callable]:
+        """Returns function, parsing a single (not container) value"""
+        if self.parser is not None:
+            return self.parser
+        if self.datetime:
+            return helpers.parse_datetime
+        if self.model is not None:
+            if self.interned:
+                return functools.partial(interning.intern_model, self.model)
+            return self.model.json_parse
+        if self.interned:
+            return interning.intern_dict
+        return None
+
+    def value_parser(self) -> typing.Optional[typing.Callable]:
+        """Returns function, parsing the whole non-empty value"""
+        if self.container is None or self.parser is not None:
+            return self.item_parser()
+        if self.container == "list" and self.interned and self.model is None:
+            return interning.intern_dict_list
+        item_parser = self.item_parser()
+        if item_parser is None:
+            return None
+        if self.container == "list":
+            return lambda value: [item_parser(item) for item in value]
+        return lambda value: {key: item_parser(item) for key, item in value.items()}
+
+
+def source_keys(cls, name: str) -> typing.Tuple[str, ...]:
+    field = cls._schema.get(name)
+    if field is None or field.source is None:
+        return (name,)
+    return tuple(field.source.split("."))
+
+
+def compile_json_parse(cls) -> classmethod:
+    """
+    Generates specialised json_parse for the model from its fields and `_schema`.
+    (Генерирует функцию json_parse модели по описанию ее полей.)
+    """
+    namespace = {"_new": object.__new__}
+    lines = [
+        "def json_parse(cls, data):",
+        "    instance = _new(cls)",
+        "    get = data.get",
+    ]
+    # dotted path prefix -> local variable, so shared nested dicts are looked up once
+    nested = {}
+    for name in cls._fields:
+        keys = source_keys(cls, name)
+        field = cls._schema.get(name)
+        if field is None:
+            item_parser = value_parser = None
+        else:
+            item_parser, value_parser = field.item_parser(), field.value_parser()
+
+        if len(keys) == 1 and value_parser is None:
+            lines.append(f"    instance.{name} = get({keys[0]!r})")
+            continue
+        if len(keys) == 1:
+            lines.append(f"    value = get({keys[0]!r})")
+        else:
+            prefix = keys[:-1]
+            variable = nested.get(prefix)
+            if variable is None:
+                variable = nested[prefix] = f"nested_{len(nested)}"
+                lines.append(f"    {variable} = get({prefix[0]!r})")
+                for key in prefix[1:]:
+                    lines.append(
+                        f"    {variable} = {variable}.get({key!r}) "
+                        f"if isinstance({variable}, dict) else None"
+                    )
+                lines.append(
+                    f"    {variable} = {variable} if isinstance({variable}, dict) else None"
+                )
+            lines.append(
+                f"    value = {variable}.get({keys[-1]!r}) if {variable} is not None else None"
+            )
+        if value_parser is None:
+            lines.append(f"    instance.{name} = value")
+        elif field.container is not None and field.parser is None:
+            # containers of nested values are unrolled in place, instead of calling a lambda
+            namespace[f"_parse_{name}"] = item_parser
+            if field.container == "list":
+                expression = f"[_parse_{name}(item) for item in value]"
+            else:
+                expression = (
+                    f"{{key: _parse_{name}(item) for key, item in value.items()}}"
+                )
+            lines.append(f"    instance.{name} = {expression} if value else None")
+        else:
+            namespace[f"_parse_{name}"] = value_parser
+            lines.append(
+                f"    instance.{name} = _parse_{name}(value) if value else None"
+            )
+    lines.append("    return instance")
+
+    source = "\n".join(lines)
+    exec(compile(source, f"<json_parse {cls.__qualname__}>", "exec"), namespace)
+    function = namespace["json_parse"]
+    function.__qualname__ = f"{cls.__qualname__}.json_parse"
+    function.__doc__ = f"Parses {cls.__name__} from the API response (generated)"
+    function._source = source
+    return classmethod(function)
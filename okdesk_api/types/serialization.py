@@ -0,0 +1,127 @@
+import datetime
+import typing
+
+from .. import helpers
+from . import interning
+
+# msgpack is an optional dependency: pip install okdesk_api[msgpack]
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_EXT_MODEL = 1
+_EXT_DATETIME = 2
+_EXT_DATE = 3
+
+_INTERNING_PARSERS = (interning.intern_dict, interning.intern_dict_list)
+
+# "module.QualName" -> model class, filled by OkDeskBaseClass.__init_subclass__
+registry: typing.Dict[str, type] = {}
+
+
+def model_key(cls: type) -> str:
+    """Returns the name of a model class in serialized data (Имя класса модели в сериализованных данных)"""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def register(cls: type):
+    # models with the same class name in different modules don't collide,
+    # a reloaded module replaces its classes
+    registry[model_key(cls)] = cls
+
+
+def _require_msgpack():
+    if msgpack is None:
+        raise ImportError(
+            "msgpack is required for serialization (pip install okdesk_api[msgpack])"
+        )
+
+
+def model_cls(instance) -> type:
+    """Returns the model class of an instance (the base class for lazy models)"""
+    return getattr(type(instance), "_model_cls", type(instance))
+
+
+def to_plain(value: typing.Any) -> typing.Any:
+    """
+    Converts models inside value into dicts (recursively), lists/tuples into lists.
+    (Рекурсивно преобразует модели в словари.)
+    """
+    fields = getattr(value, "_fields", None)
+    if fields is not None and not isinstance(value, tuple):
+        return {name: to_plain(getattr(value, name, None)) for name in fields}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    return value
+
+
+def _encode(value):
+    fields = getattr(value, "_fields", None)
+    if fields is not None and not isinstance(value, tuple):
+        payload = [
+            model_key(model_cls(value)),
+            # None fields are skipped, they are None by default
+            {
+                name: field
+                for name, field in zip(fields, map(value.__getattribute__, fields))
+                if field is not None
+            },
+        ]
+        return msgpack.ExtType(_EXT_MODEL, _packb(payload))
+    if isinstance(value, datetime.datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, datetime.date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    raise TypeError(f"Can not serialize {type(value).__name__}")
+
+
+def _decode(code: int, data: bytes):
+    if code == _EXT_MODEL:
+        name, fields = _unpackb(data)
+        cls = registry.get(name)
+        if cls is None:
+            raise ValueError(f"Unknown model {name!r}")
+        instance = cls()
+        for field, value in fields.items():
+            if field in cls._fields:
+                parser = cls._field_parsers.get(field)
+                if parser in _INTERNING_PARSERS:
+                    # shared reference dicts are shared again after loading
+                    value = parser(value)
+                setattr(instance, field, value)
+        return instance
+    if code == _EXT_DATETIME:
+        return helpers.parse_datetime(data.decode())
+    if code == _EXT_DATE:
+        return datetime.date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def _packb(value) -> bytes:
+    return msgpack.packb(value, default=_encode, use_bin_type=True)
+
+
+def _unpackb(data: bytes):
+    return msgpack.unpackb(
+        data, ext_hook=_decode, raw=False, strict_map_key=False, use_list=True
+    )
+
+
+def dumps(value: typing.Any) -> bytes:
+    """
+    Serializes models (or lists/dicts of models) into msgpack bytes. Datetimes, dates and nested
+    models are preserved. (Сериализует модели в байты msgpack.)
+    """
+    _require_msgpack()
+    return _packb(value)
+
+
+def loads(data: bytes) -> typing.Any:
+    """
+    Deserializes value, serialized by `dumps`. (Десериализует значение, сериализованное `dumps`.)
+    """
+    _require_msgpack()
+    return _unpackb(data)
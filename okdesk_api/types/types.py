@@ -1,11 +1,89 @@
+import collections
+import functools
 import typing
 
+from .. import helpers
+from . import serialization
+from .schema import Field, compile_json_parse, source_keys
+from .interning import FrozenDict
+
+
+class _LazyField:
+    """
+    Data descriptor used by lazy models: parses the field from the raw dict on first access
+    and stores the result in the slot of the model class.
+    """
+
+    __slots__ = ("name", "keys", "parser", "slot")
+
+    def __init__(
+        self,
+        name: str,
+        keys: typing.Tuple[str, ...],
+        parser: typing.Optional[typing.Callable],
+        slot,
+    ):
+        self.name = name
+        self.keys = keys
+        self.parser = parser
+        self.slot = slot
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+        value = instance._raw.get(self.keys[0])
+        for key in self.keys[1:]:
+            value = value.get(key) if isinstance(value, dict) else None
+        if self.parser is not None:
+            value = self.parser(value) if value else None
+        self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
+
 
 class OkDeskBaseClass:
+    # every subclass declares its fields in __slots__, so instances have no per-instance __dict__
+    __slots__ = ()
+    _fields: typing.Tuple[str, ...] = ()
+    # field name -> Field, describing how to read it. Fields, which are not listed, are copied as is
+    _schema: typing.Dict[str, Field] = {}
+    # field name -> function converting a non-empty raw value, built from _schema
+    _field_parsers: typing.Dict[str, typing.Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if not name.startswith("_") and name not in fields:
+                    fields.append(name)
+        cls._fields = tuple(fields)
+        if "_model_cls" in cls.__dict__:
+            # lazy and frozen variants reuse everything from their model class
+            return
+        cls._field_parsers = {}
+        for name, field in cls._schema.items():
+            parser = field.value_parser()
+            if parser is not None:
+                cls._field_parsers[name] = parser
+        if "json_parse" not in cls.__dict__ and cls._fields:
+            cls.json_parse = compile_json_parse(cls)
+        # lazy and frozen variants are serialized as their model class, so they are not registered
+        serialization.register(cls)
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
-            + ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+            + ", ".join(f"{k}={getattr(self, k, None)!r}" for k in self._fields)
             + ")"
         )
 
@@ -13,8 +91,265 @@ class OkDeskBaseClass:
     def json_parse(cls, data: dict) -> "OkDeskBaseClass":
         raise NotImplementedError
 
+    def to_dict(self) -> dict:
+        """
+        Returns dict of fields, nested models are converted into dicts too.
+        Datetimes are kept as datetime objects. (Возвращает словарь полей модели.)
+        """
+        return serialization.to_plain(self)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the model into compact msgpack bytes (requires msgpack).
+        Datetimes and nested models are preserved, lazy models are serialized as regular ones.
+        (Сериализует модель в байты msgpack.)
+        """
+        return serialization.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "OkDeskBaseClass":
+        """
+        Deserializes the model from bytes, returned by `to_bytes`. (Восстанавливает модель из байтов)
+        """
+        instance = serialization.loads(data)
+        if not isinstance(instance, cls):
+            raise TypeError(f"Expected {cls.__name__}, got {type(instance).__name__}")
+        return instance
+
+    @classmethod
+    def json_parse_lazy(cls, data: dict) -> "OkDeskBaseClass":
+        """
+        Returns an instance of a lazy subclass of `cls`, which keeps the raw dict
+        and parses every field on first access (empty values become None, like in json_parse).
+        (Возвращает "ленивый" экземпляр: поля разбираются из исходного словаря при первом обращении.)
+        """
+        lazy_cls = cls.__dict__.get("_lazy_cls") or cls._make_lazy_cls()
+        instance = object.__new__(lazy_cls)
+        instance._raw = data
+        return instance
+
+    @classmethod
+    def _make_lazy_cls(cls) -> type:
+        namespace = {
+            "__slots__": ("_raw",),
+            "__module__": cls.__module__,
+            "__reduce__": _lazy_reduce,
+            "_model_cls": cls,
+        }
+        for name in cls._fields:
+            slot = next(
+                klass.__dict__[name]
+                for klass in cls.__mro__
+                if name in klass.__dict__.get("__slots__", ())
+            )
+            namespace[name] = _LazyField(
+                name, source_keys(cls, name), cls._field_parsers.get(name), slot
+            )
+        lazy_cls = type(cls)(f"Lazy{cls.__name__}", (cls,), namespace)
+        cls._lazy_cls = lazy_cls
+        return lazy_cls
+
+    def freeze(self) -> "OkDeskBaseClass":
+        """
+        Returns an immutable copy of the model: lists become tuples, dicts become FrozenDict
+        and nested models are frozen too. Frozen instances can be shared without copying,
+        copy.copy/copy.deepcopy return the same instance.
+        (Возвращает неизменяемую копию модели, которую можно передавать без копирования.)
+        """
+        if type(self).__dict__.get("_is_frozen"):
+            return self
+        model_cls = getattr(type(self), "_model_cls", type(self))
+        frozen_cls = (
+            model_cls.__dict__.get("_frozen_cls") or model_cls._make_frozen_cls()
+        )
+        return _make_frozen(
+            frozen_cls,
+            {name: _freeze_value(getattr(self, name, None)) for name in self._fields},
+        )
+
+    @classmethod
+    def json_parse_frozen(cls, data: dict) -> "OkDeskBaseClass":
+        """
+        Parses the model and returns its frozen variant, see `freeze`.
+        (Разбирает модель и возвращает ее неизменяемый вариант.)
+        """
+        return cls.json_parse(data).freeze()
+
+    @classmethod
+    def _make_frozen_cls(cls) -> type:
+        namespace = {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__setattr__": _frozen_setattr,
+            "__delattr__": _frozen_setattr,
+            "__copy__": lambda self: self,
+            "__deepcopy__": lambda self, memo: self,
+            "__reduce__": _frozen_reduce,
+            "_model_cls": cls,
+            "_is_frozen": True,
+        }
+        frozen_cls = type(cls)(f"Frozen{cls.__name__}", (cls,), namespace)
+        cls._frozen_cls = frozen_cls
+        return frozen_cls
+
+    @classmethod
+    def json_project(
+        cls, data: dict, fields: typing.Sequence[str]
+    ) -> typing.NamedTuple:
+        """
+        Builds a lightweight record (namedtuple) with only the requested fields, skipping everything else.
+        A field is either a model field ("updated_at", parsed the same way as in json_parse),
+        or a dotted path into a nested dict ("status.code", returned as is, None if missing).
+        Dots are replaced with underscores in record attribute names: record.status_code
+        (Возвращает легковесную запись только с запрошенными полями.)
+        """
+        record_cls, getters = cls._projection(tuple(fields))
+        values = []
+        for keys, parser in getters:
+            value = data
+            for key in keys:
+                value = value.get(key) if isinstance(value, dict) else None
+            if parser is not None:
+                value = parser(value) if value else None
+            values.append(value)
+        return record_cls._make(values)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _projection(cls, paths: typing.Tuple[str, ...]) -> tuple:
+        getters = []
+        for path in paths:
+            keys = tuple(path.split("."))
+            if keys[0] not in cls._fields:
+                raise ValueError(f"{cls.__name__} has no field {keys[0]!r}")
+            parser = None
+            if len(keys) == 1:
+                keys = source_keys(cls, path)
+                parser = cls._field_parsers.get(path)
+            getters.append((keys, parser))
+        return _record_cls(cls.__name__, paths), tuple(getters)
+
+
+class ParametersMixin(OkDeskBaseClass):
+    """
+    Typed access to custom `parameters` ([{code, name, field_type, value}, ...]) of a model.
+    The code -> value index is built once on first access and rebuilt only if `parameters` is replaced
+    or its length changes. (Типизированный доступ к дополнительным атрибутам модели по коду.)
+    """
+
+    __slots__ = ("_parameters_index", "_parameters_key")
+
+    @property
+    def parameters_index(self) -> typing.Dict[str, typing.Any]:
+        """
+        Dict of parameter code -> value, converted according to field_type
+        (see helpers.convert_parameter_value). (Словарь код атрибута -> значение)
+        """
+        parameters = self.parameters or ()
+        try:
+            key = self._parameters_key
+            if key[0] is parameters and key[1] == len(parameters):
+                return self._parameters_index
+        except AttributeError:
+            pass
+        index = {
+            parameter.get("code"): helpers.convert_parameter_value(
+                parameter.get("field_type"), parameter.get("value")
+            )
+            for parameter in parameters
+        }
+        self._parameters_index = index
+        self._parameters_key = (parameters, len(parameters))
+        return index
+
+    def get_parameter(self, code: str, default: typing.Any = None) -> typing.Any:
+        """
+        Returns converted value of custom parameter by its code.
+        (Возвращает значение дополнительного атрибута по коду.)
+
+        :param code: Code of the parameter (Код атрибута)
+        :param default: Returned if there is no such parameter (Значение по умолчанию)
+        """
+        return self.parameters_index.get(code, default)
+
+
+@functools.lru_cache(maxsize=None)
+def _record_cls(model_name: str, paths: typing.Tuple[str, ...]) -> type:
+    record_cls = collections.namedtuple(
+        f"{model_name}Record", [path.replace(".", "_") for path in paths]
+    )
+    # record classes are created on the fly, so pickle has to rebuild them
+    record_cls.__reduce__ = lambda self: (
+        _make_record,
+        (model_name, paths, tuple(self)),
+    )
+    return record_cls
+
+
+def _make_record(
+    model_name: str, paths: typing.Tuple[str, ...], values: tuple
+) -> typing.NamedTuple:
+    return _record_cls(model_name, paths)._make(values)
+
+
+def _lazy_reduce(self):
+    # lazy classes are created on the fly and can't be found by pickle,
+    # so they are rebuilt from the raw dict plus the fields that were already materialized
+    materialized = {}
+    for name in self._fields:
+        try:
+            materialized[name] = type(self).__dict__[name].slot.__get__(self)
+        except AttributeError:
+            pass
+    return self._model_cls.json_parse_lazy, (self._raw,), (None, materialized)
+
+
+def _freeze_value(value):
+    if isinstance(value, OkDeskBaseClass):
+        return value.freeze()
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(item) for item in value)
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze_value(item)) for key, item in value.items())
+    return value
+
+
+def _frozen_setattr(self, name, *args):
+    # private slots hold caches (e.g. parameters index), they stay writable
+    if name.startswith("_"):
+        if args:
+            object.__setattr__(self, name, *args)
+        else:
+            object.__delattr__(self, name)
+        return
+    raise AttributeError(f"{type(self).__name__} is frozen, can not change {name!r}")
+
+
+def _make_frozen(frozen_cls: type, fields: dict) -> "OkDeskBaseClass":
+    instance = object.__new__(frozen_cls)
+    for name, value in fields.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def _frozen_reduce(self):
+    # frozen classes are created on the fly, so pickle rebuilds them from the model class
+    fields = {name: getattr(self, name) for name in self._fields}
+    return _unpickle_frozen, (self._model_cls, fields)
+
+
+def _unpickle_frozen(model_cls: type, fields: dict) -> "OkDeskBaseClass":
+    frozen_cls = model_cls.__dict__.get("_frozen_cls") or model_cls._make_frozen_cls()
+    return _make_frozen(frozen_cls, fields)
+
 
 class ApiRequest:
+    # attributes, used by from_response. Only they are sent to a parse worker process,
+    # the request itself may hold unpicklable values, such as files and callbacks
+    _parse_options: typing.Tuple[str, ...] = ()
+
     # method: typing.Literal["GET", "POST", "PUT", "DELETE", "PATCH"], url: str, **kwargs
     def to_request(self) -> dict:
         raise NotImplementedError
@@ -22,6 +357,24 @@ class ApiRequest:
     def from_response(self, result) -> typing.Any:
         raise NotImplementedError
 
+    def parse_state(self) -> typing.Tuple[type, dict]:
+        """
+        Returns request class and parse options, enough to call from_response in another process,
+        see `from_parse_state`. (Возвращает класс запроса и параметры разбора ответа.)
+        """
+        return type(self), {name: getattr(self, name) for name in self._parse_options}
+
+    @staticmethod
+    def from_parse_state(state: typing.Tuple[type, dict]) -> "ApiRequest":
+        """
+        Creates a request, which can only parse responses, without calling __init__.
+        (Создает запрос, пригодный только для разбора ответа.)
+        """
+        cls, options = state
+        request = cls.__new__(cls)
+        request.__dict__.update(options)
+        return request
+
 
 """
 The following types are used when MAKING requests to the API.
@@ -67,11 +420,18 @@ class Attachment(typing.TypedDict):
     attachment 	    string 	    обязательный 	Прикрепляемый файл
     description 	string 	    опционально 	Описание файла
     is_public 	    boolean 	опционально 	Публичность файла
+
+    attachment can be a path, bytes/memoryview, binary file object or async iterator of bytes.
+    filename is required for bytes and async iterators, content_type is guessed from it by default.
+    (attachment - путь, байты, двоичный файловый объект или асинхронный итератор байтов.
+    Для байтов и итераторов необходимо указать filename.)
     """
 
-    attachment: str
+    attachment: "helpers.FileSource"
     description: typing.NotRequired[str]
     is_public: typing.NotRequired[bool]
+    filename: typing.NotRequired[str]
+    content_type: typing.NotRequired[str]
 
 
 class CodeNamePair(typing.TypedDict):
@@ -22,7 +22,10 @@ setup(
         "okdesk_api.client",
         "okdesk_api.errors",
         "okdesk_api.helpers",
+        "okdesk_api.analytics",
+        "okdesk_api.cache",
     ],
+    extras_require={"analytics": ["numpy"], "msgpack": ["msgpack"]},
     url="",
     license="",
     author="apepenkov",